@@ -3,18 +3,19 @@ import os
 import time
 import traceback
 from argparse import ArgumentParser, RawTextHelpFormatter
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import discord
 import lavalink
 from discord.ext import commands
 from discord.flags import MemberCacheFlags
 
-import aiohttp
 import yaml
 
-from musicbot.utils.localisation import Aliaser, LocalizedContext, Localizer, LocalizerWrapper
+from musicbot.utils.httpclient import HttpClient
+from musicbot.utils.localisation import Aliaser, LocalizedContext, Localizer, LocalizerWrapper, ParsedFileCache
 from musicbot.utils.logger import BotLogger
+from musicbot.utils.mixplayer.presets import FilterPresets
 from musicbot.utils.settingsmanager import Settings
 
 on_ready_extensions = [
@@ -27,28 +28,52 @@ on_ready_extensions = [
 ]
 
 
+def _get_intents(lean: bool):
+    """Gateway intents and member cache policy for the bot.
+
+    Lean mode only subscribes to what the bot uses, and only caches members that are in voice. Anything else
+    looking up members by id must be able to handle a cache miss.
+    """
+    if not lean:
+        intents = discord.Intents.all()
+        return intents, MemberCacheFlags.from_intents(intents)
+
+    intents = discord.Intents.none()
+    intents.guilds = True
+    intents.voice_states = True
+    intents.guild_messages = True
+    intents.dm_messages = True
+    intents.guild_reactions = True
+    intents.message_content = True
+    return intents, MemberCacheFlags(voice=True, joined=False)
+
+
 def _get_prefix(bot, message):
-    if not message.guild:
-        prefix = bot.settings.default_prefix
-        return commands.when_mentioned_or(prefix)(bot, message)
-    prefixes = bot.settings.get(message.guild, 'prefixes', 'default_prefix')
-    return commands.when_mentioned_or(*prefixes)(bot, message)
+    return list(bot.get_guild_prefixes(message.guild))
 
 
 class MusicBot(commands.Bot):
     def __init__(self, datadir, debug: bool = False):
-        intents = discord.Intents.all()
+        intents, member_cache_flags = _get_intents(conf["bot"].get("lean intents", False))
         super().__init__(command_prefix=_get_prefix,
                          description=conf["bot"]["description"],
                          intents=intents,
-                         member_cache_flags=MemberCacheFlags.from_intents(intents)
+                         member_cache_flags=member_cache_flags
                          )
 
-        self.settings = Settings(datadir, **conf['default server settings'])
+        self.settings = Settings(datadir, backend=conf.get('settings backend', 'yaml'),
+                                 **conf['default server settings'])
+        self.filter_presets = FilterPresets(self.settings, conf.get('filter presets'))
         self.APIkeys = conf.get('APIkeys', {})
+        # Reload localization and alias files when they change, meant for editing translations
+        self.watch_localizations: bool = conf.get('watch localizations', False)
 
-        self.localizer: Localizer = Localizer(conf.get('locale path', "./localization"), conf.get('locale', 'en_en'))
-        self.aliaser: Aliaser = Aliaser(conf.get('locale path', "./localization"), conf.get('locale', 'en_en'))
+        # Parsed localization files are cached in the data directory for faster startup
+        localization_cache = ParsedFileCache(f"{datadir}/bot/localization.cache")
+        self.localizer: Localizer = Localizer(conf.get('locale path', "./localization"), conf.get('locale', 'en_en'),
+                                              file_cache=localization_cache)
+        self.aliaser: Aliaser = Aliaser(conf.get('locale path', "./localization"), conf.get('locale', 'en_en'),
+                                        file_cache=localization_cache)
 
         self.datadir = datadir
         self.debug: bool = debug
@@ -56,10 +81,44 @@ class MusicBot(commands.Bot):
         self.logger = self.main_logger.bot_logger.getChild("Bot")
         self.logger.debug("Debug: %s" % debug)
         self.lavalink: Optional[lavalink.Client] = None
+        # Created in setup_hook, it needs the event loop
+        self.http_client: Optional[HttpClient] = None
+
+        # Prefixes including mentions, by guild id. None is used for DMs.
+        self._guild_prefixes: Dict[Optional[int], Tuple[str, ...]] = {}
+
+    def get_guild_prefixes(self, guild: Optional[discord.Guild]) -> Tuple[str, ...]:
+        """All prefixes that can invoke a command in a guild, mentions first."""
+        guild_id = guild.id if guild else None
+        try:
+            return self._guild_prefixes[guild_id]
+        except KeyError:
+            pass
+
+        if guild:
+            prefixes = self.settings.get(guild, 'prefixes', 'default_prefix')
+        else:
+            prefixes = self.settings.default_prefix
+        if isinstance(prefixes, str):
+            prefixes = [prefixes]
+
+        if self.user is None:
+            return tuple(prefixes)  # Not logged in, we don't know the mentions yet
+
+        mentions = (f'<@{self.user.id}> ', f'<@!{self.user.id}> ')
+        self._guild_prefixes[guild_id] = mentions + tuple(prefixes)
+        return self._guild_prefixes[guild_id]
+
+    def invalidate_guild_prefixes(self, guild: discord.Guild):
+        """Must be called when the prefixes of a guild are changed."""
+        self._guild_prefixes.pop(guild.id, None)
 
     async def on_message(self, message):
         if message.author.bot:
             return
+        # Most messages are not commands, skip them before creating a context
+        if not message.content.startswith(self.get_guild_prefixes(message.guild)):
+            return
         await self.process_commands(message)
 
     async def process_commands(self, message):
@@ -96,13 +155,22 @@ class MusicBot(commands.Bot):
             self.logger.info(border)
         self.logger.debug("Bot Ready")
 
-        self.session = aiohttp.ClientSession(loop=self.loop)
-
         if presence := conf["bot"]["playing status"]:
             await self.change_presence(activity=discord.Game(type=0,
                                                              name=presence),
                                        status=discord.Status.online)
 
+    async def setup_hook(self):
+        # Shared by everything fetching from the web, lives as long as the bot instead of a connection
+        self.http_client = HttpClient()
+
+    async def close(self):
+        await super().close()
+        if self.http_client:
+            await self.http_client.close()
+        # Write any settings changes that are still waiting for the background writer
+        self.settings.close()
+
     def run(self):
         try:
             super().run(conf["bot"]["token"], reconnect=True)
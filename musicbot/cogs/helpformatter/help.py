@@ -1,16 +1,49 @@
+from collections import OrderedDict
+
 from discord.ext import commands
 
 from bot import MusicBot
+from musicbot.utils import checks
 from musicbot.utils.userinteraction.scroller import ClearMode, Scroller
 
 from .helpformatter import coghelper, commandhelper, helper, prefix_cleaner
 
+MAX_CACHED_PAGINATORS = 256
+
 
 class Help(commands.Cog):
     """Help command."""
 
     def __init__(self, bot: MusicBot):
         self.bot: MusicBot = bot
+        # Help paginators by (locale, prefix, color, permission profile, cog), the scroller only reads them
+        self._paginators: OrderedDict = OrderedDict()
+        self._paginators_built_from = ()
+
+    def _check_paginator_cache(self):
+        """Clears the cached paginators when cogs have been (re)loaded or localizations reloaded."""
+        # Reloads swap in new objects, so comparing identities is enough
+        built_from = (self.bot.localizer.localization_table, self.bot.aliaser.localization_table,
+                      *self.bot.cogs.values())
+        if len(built_from) != len(self._paginators_built_from) or \
+                any(new is not old for new, old in zip(built_from, self._paginators_built_from, strict=True)):
+            self._paginators.clear()
+            self._paginators_built_from = built_from
+
+    async def cached_paginator(self, ctx, cog=None):
+        """The help paginator for a cog, or for all cogs if None."""
+        self._check_paginator_cache()
+        key = (ctx.locale, ctx.prefix, ctx.me.color.value, await checks.permission_profile(ctx),
+               cog.__cog_name__ if cog else None)
+        if (paginator := self._paginators.get(key)) is not None:
+            self._paginators.move_to_end(key)
+            return paginator
+
+        paginator = await coghelper(ctx, cog) if cog else await helper(ctx)
+        self._paginators[key] = paginator
+        if len(self._paginators) > MAX_CACHED_PAGINATORS:
+            self._paginators.popitem(last=False)
+        return paginator
 
     @commands.command(hidden=True)
     async def help(self, ctx):  # Takes no args because reasons(using the view directly)
@@ -23,7 +56,7 @@ class Help(commands.Cog):
         ctx = prefix_cleaner(ctx)
 
         if not command:
-            paginator = await helper(ctx)
+            paginator = await self.cached_paginator(ctx)
 
         if command:
             thing = ctx.bot.get_cog(command) or ctx.bot.get_command(command)
@@ -32,7 +65,7 @@ class Help(commands.Cog):
             if isinstance(thing, commands.Command):
                 paginator = commandhelper(ctx, thing, invoker)
             else:
-                paginator = await coghelper(ctx, thing)
+                paginator = await self.cached_paginator(ctx, thing)
 
         scroller = Scroller(ctx, paginator)
         await scroller.start_scrolling(ClearMode.Timeout | ClearMode.ManualExit)
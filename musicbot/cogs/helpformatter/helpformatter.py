@@ -15,8 +15,9 @@ def get_cmd_dict(ctx, qualified_name):
     if not cmd_dict:
         cmd_dict = ctx.bot.aliaser.get_cmd_help("en_en", split[-1], split[:-1])
         try:
-            cmd_dict["aliases"] = [split[-1]]
-        except KeyError:
+            # Copy, the help dictionaries are shared with the aliaser and its file cache
+            cmd_dict = {**cmd_dict, "aliases": [split[-1]]}
+        except TypeError:
             cmd_dict = None
     return cmd_dict
 
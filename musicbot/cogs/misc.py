@@ -2,7 +2,7 @@ import platform
 import time
 
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from lavalink import __version__ as LavalinkVersion
 
 from bot import MusicBot
@@ -12,6 +12,12 @@ from musicbot.utils import bot_version
 class Misc(commands.Cog):
     def __init__(self, bot: MusicBot):
         self.bot: MusicBot = bot
+        self.logger = self.bot.main_logger.bot_logger.getChild("Misc")
+        if self.bot.watch_localizations:
+            self.localization_watcher.start()
+
+    async def cog_unload(self):
+        self.localization_watcher.cancel()
 
     def get_uptime(self):
         now = time.time()
@@ -52,7 +58,7 @@ class Misc(commands.Cog):
         listeners = 0
         if lavalink := self.bot.lavalink:
             for _, player in lavalink.player_manager.players.items():
-                listeners += len(player.listeners)
+                listeners += player.listener_count
 
             embed.add_field(name='{music.players}', value=f'{len(lavalink.player_manager.players)}')
             embed.add_field(name='{music.listeners}', value=f'{listeners}')
@@ -62,22 +68,21 @@ class Misc(commands.Cog):
     @commands.command(name="reloadlocale")
     @commands.is_owner()
     async def reload_locale(self, ctx):
-        self.bot.localizer.index_localizations()
-        self.bot.localizer.load_localizations()
+        await self.bot.localizer.reload(changed_only=False)
         await ctx.send("Localizations reloaded.")
 
     @commands.command(name="reloadalias")
     @commands.is_owner()
     async def reload_alias(self, ctx):
-        self.bot.aliaser.index_localizations()
-        self.bot.aliaser.load_localizations()
+        await self.bot.aliaser.reload(changed_only=False)
         await ctx.send("Aliases reloaded.")
 
     @commands.command()
     async def info(self, ctx):
         """Info about the bot."""
         guilds = len(self.bot.guilds)
-        members = len(self.bot.users)
+        # The user cache only holds members in voice when running with lean intents
+        members = sum(guild.member_count or 0 for guild in self.bot.guilds)
 
         days, hours, minutes, seconds = self.get_uptime()
         avatar_url = self.bot.user.display_avatar.replace(static_format='png', size=1024).url
@@ -104,6 +109,18 @@ class Misc(commands.Cog):
                                            _bot_v=bot_version.bot_version)
         await ctx.send(embed=embed)
 
+    @tasks.loop(seconds=10.0)
+    async def localization_watcher(self):
+        """Reloads the languages whose localization or alias files changed."""
+        try:
+            if languages := await self.bot.localizer.reload():
+                self.logger.info("Reloaded localizations: %s", ', '.join(sorted(languages)))
+            if languages := await self.bot.aliaser.reload():
+                self.logger.info("Reloaded aliases: %s", ', '.join(sorted(languages)))
+        except Exception as err:
+            self.logger.error("Error in localization_watcher loop")
+            self.logger.exception(err)
+
 
 async def setup(bot):
     await bot.add_cog(Misc(bot))
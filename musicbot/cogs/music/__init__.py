@@ -8,22 +8,14 @@ import lavalink
 from discord import VoiceChannel
 from discord.ext import commands, tasks
 from lavalink import AudioTrack
-from lavalink.events import (
-    NodeChangedEvent,
-    NodeConnectedEvent,
-    NodeDisconnectedEvent,
-    PlayerUpdateEvent,
-    QueueEndEvent,
-    TrackEndEvent,
-    TrackStartEvent,
-    TrackStuckEvent,
-)
-
-from bs4 import BeautifulSoup
+from lavalink.events import QueueEndEvent, TrackEndEvent
 
 from bot import MusicBot
 from musicbot.utils import checks, timeformatter
+from musicbot.utils.lyrics import LyricsCache, extract_lyrics
 from musicbot.utils.mixplayer.player import MixPlayer
+from musicbot.utils.mixplayer.presets import NO_PRESET, RESERVED_NAMES
+from musicbot.utils.mixplayer.track_length import TrackLengthPolicy
 from musicbot.utils.thumbnailer import Thumbnailer
 from musicbot.utils.userinteraction.paginators import QueuePaginator, TextPaginator
 from musicbot.utils.userinteraction.scroller import ClearMode, Scroller
@@ -32,8 +24,10 @@ from musicbot.utils.userinteraction.selector import (
     Selector,
     SelectorButton,
     SelectorItem,
+    SelectorItems,
     selector_button_callback,
 )
+from musicbot.utils.userinteraction.vote_sessions import VoteSessions
 
 from .decorators import require_playing, require_queue, require_voice_connection, voteable
 from .music_errors import MusicError, PlayerNotAvailableError, WrongTextChannelError
@@ -48,12 +42,16 @@ class Music(commands.Cog):
         self.logger = self.bot.main_logger.bot_logger.getChild("Music")
 
         self.thumbnailer = Thumbnailer(bot=self.bot)
+        self.lyrics_cache = LyricsCache(f"{self.bot.datadir}/bot/lyrics.sqlite")
+        self.vote_sessions = VoteSessions()
 
         self.leave_timer.start()
         if self.bot.lavalink is None:
             raise MusicError("Lavalink is not yet initialized")
         self.lavalink: lavalink.Client = self.bot.lavalink
-        self.lavalink.add_event_hook(self.track_hook)
+        # Hooks are registered by event type, lavalink only calls them for events of that type
+        self.lavalink.add_event_hook(self.on_track_end, event=TrackEndEvent)
+        self.lavalink.add_event_hook(self.on_queue_end, event=QueueEndEvent)
 
     async def cog_check(self, ctx):
         if not ctx.guild:
@@ -82,15 +80,20 @@ class Music(commands.Cog):
         track_duration_str = timeformatter.format_track_duration(track)
 
         # Only add tracks that don't exceed the max track length
-        maxlength = self.max_track_length(ctx.guild, player)
-        if (track.stream or track.duration > maxlength) and check_max_length:
-            embed.description = ctx.localizer.format_str("{enqueue.toolong}",
-                                                         _length=track_duration_str,
-                                                         _max=timeformatter.format_ms(maxlength))
-            return False
+        if check_max_length:
+            policy = self.track_length_policy(ctx.guild, player)
+            if not policy.allows(track, player.listener_count):
+                maxlength = policy.max_length(player.listener_count)
+                embed.description = ctx.localizer.format_str("{enqueue.toolong}",
+                                                             _length=track_duration_str,
+                                                             _max=timeformatter.format_ms(maxlength))
+                return False
 
         track.extra["thumbnail_url"] = await self.thumbnailer.identify(track.identifier, track.uri)
         track.requester = ctx.author.id
+        # Keep what we display about the requester, they might not be in the member cache when the track plays
+        track.extra["requester_name"] = ctx.author.display_name
+        track.extra["requester_avatar"] = ctx.author.display_avatar.url
 
         # Add to player
         track, pos_global, pos_local = player.add(requester=ctx.author, track=track)
@@ -131,22 +134,17 @@ class Music(commands.Cog):
 
         if member := ctx.guild.get_member(player.current.requester):
             embed.set_footer(text=f'{{requested_by}} {member.display_name}', icon_url=member.display_avatar.url)
+        elif requester_name := player.current.extra.get("requester_name"):
+            embed.set_footer(text=f'{{requested_by}} {requester_name}',
+                             icon_url=player.current.extra.get("requester_avatar"))
 
         embed = ctx.localizer.format_embed(embed)
         return embed
 
-    def max_track_length(self, guild, player) -> float:
-        # Numeric constants
-        minimum_dynamic_length = 10
-        minutes_to_milliseconds = 60 * 1000
-        configured_max = self.bot.settings.get(guild, 'duration.max', float('inf'))
-        is_dynamic = self.bot.settings.get(guild, 'duration.is_dynamic', 'default_duration_type')
-        listeners = max(1, len(player.listeners))  # Avoid division by 0
-
-        if configured_max > minimum_dynamic_length and is_dynamic:
-            return minutes_to_milliseconds * max(configured_max/listeners, minimum_dynamic_length)
-        else:
-            return minutes_to_milliseconds * configured_max
+    def track_length_policy(self, guild, player) -> TrackLengthPolicy:
+        if player.track_length_policy is None:
+            player.track_length_policy = TrackLengthPolicy(self.bot.settings, guild)
+        return player.track_length_policy
 
     async def _search_and_play_query(self, ctx, query: str, check_max_length: bool):
         self.logger.debug("Query: %s" % query)
@@ -164,8 +162,12 @@ class Music(commands.Cog):
         embed = discord.Embed(color=ctx.me.color)
 
         if results.load_type == 'PLAYLIST_LOADED':
-            tracks = [track for track in results.tracks if
-                      await self.enqueue(ctx, track, embed, True, check_max_length)]
+            tracks = results.tracks
+            if check_max_length:
+                # The whole playlist is checked at once, against the same limit
+                tracks = self.track_length_policy(ctx.guild, player).filter(tracks, player.listener_count)
+            for track in tracks:
+                await self.enqueue(ctx, track, embed, standalone=True, check_max_length=False)
             if tracks:
                 embed.title = '{playlist_enqued}'
                 embed.description = f'{results.playlist_info.name} - {len(tracks)} {{tracks}}'
@@ -309,19 +311,19 @@ class Music(commands.Cog):
             async def return_track(_interaction, _button, track):
                 return track
 
-            choices = []
-            for index, track in enumerate(queue, start=1):
+            # Choices are only made for the tracks on the page being displayed
+            def make_choice(position, track):
+                index = position + 1
                 blank = " " * 6
                 if first:
                     prefix = f'`{blank}`\n`{index:<6}`'
                 else:
                     prefix = f'`{index:<3}-> `\n`{blank}`'
                 label = f'{prefix} [{track.title}]({track.uri})'
-                selection = SelectorItem(label, str(index), return_track(track))
-                choices.append(selection)
+                return SelectorItem(label, str(index), return_track(track))
 
-            return Selector(ctx, choices, select_mode=SelectMode.SpanningMultiSelect, use_tick_for_stop_emoji=True,
-                            color=ctx.me.color, title=ctx.localizer.format_str(title))
+            return Selector(ctx, SelectorItems(queue, make_choice), select_mode=SelectMode.SpanningMultiSelect,
+                            use_tick_for_stop_emoji=True, color=ctx.me.color, title=ctx.localizer.format_str(title))
 
         message = None
         page = 0
@@ -382,15 +384,13 @@ class Music(commands.Cog):
             else:
                 button.style = discord.ButtonStyle.red
 
-        selector_buttons = []
-        # Build each selection from the queue, a visible string and a callback.
-        for index, track in enumerate(queue, start=1):
-            requester = self.bot.get_user(track.requester)
-            selector_buttons.append(
-                SelectorItem(f'`{index}` [{track.title}]({track.uri}) - {requester.mention if requester else ""}',
-                             str(index), update_remove_list(tracks_to_remove, track)))
+        # Build a selection from a track of the queue, a visible string and a callback, for the displayed page only.
+        # Mentions are built from the requester id, the requester is not necessarily in the member cache
+        def make_choice(position, track: AudioTrack):
+            return SelectorItem(f'`{position + 1}` [{track.title}]({track.uri}) - <@{track.requester}>',
+                                str(position + 1), update_remove_list(tracks_to_remove, track))
 
-        remove_selector = Selector(ctx, selector_buttons, select_mode=SelectMode.MultiSelect,
+        remove_selector = Selector(ctx, SelectorItems(queue, make_choice), select_mode=SelectMode.MultiSelect,
                                    use_tick_for_stop_emoji=True, color=ctx.me.color, title='Select songs to remove')
         _, timed_out, _ = await remove_selector.start_scrolling(ClearMode.AnyExit)
 
@@ -402,8 +402,7 @@ class Music(commands.Cog):
             for track in tracks_to_remove:
                 if remove_result := player.remove_track(track):
                     (position, removed_track) = remove_result
-                    if requester := self.bot.get_user(removed_track.requester):
-                        tracks_removed.append((position, f"{removed_track.title} - {requester.mention}"))
+                    tracks_removed.append((position, f"{removed_track.title} - <@{removed_track.requester}>"))
 
             # remove_track returns the global queue index of the track,
             # so we display the removed tracks in "queue order"
@@ -573,9 +572,7 @@ class Music(commands.Cog):
         """Reset the equalizer and volume."""
         player = self.get_player(ctx.guild)
 
-        await player.set_volume(100)
-        await player.bassboost(False)
-        await player.nightcoreify(False)
+        await player.update_audio(volume=100, bassboost=False, nightcore=False, preset=NO_PRESET)
 
         embed = discord.Embed(description='{volume.reset}', color=ctx.me.color)
         embed = ctx.localizer.format_embed(embed)
@@ -609,6 +606,30 @@ class Music(commands.Cog):
         embed = ctx.localizer.format_embed(embed)
         await ctx.send(embed=embed)
 
+    @commands.command(name='preset')
+    @checks.dj_or(alone=True)
+    @require_voice_connection()
+    async def _preset(self, ctx, name: Optional[str] = None):
+        """Applies a filter preset, lists the presets if no preset is given."""
+        player = self.get_player(ctx.guild)
+        presets = self.bot.filter_presets
+
+        embed = discord.Embed(color=ctx.me.color)
+        if name is None:
+            embed.title = '{preset.title}'
+            embed.description = ', '.join(f'`{preset}`' for preset in presets.names(ctx.guild))
+            embed.set_footer(text=player.preset.name)
+        elif name.lower() in RESERVED_NAMES:
+            await player.update_audio(preset=NO_PRESET)
+            embed.description = '{preset.off}'
+        elif preset := presets.get(ctx.guild, name):
+            await player.update_audio(preset=preset)
+            embed.description = '{preset.set_to}'
+        else:
+            embed.description = '{preset.unknown}'
+        embed = ctx.localizer.format_embed(embed, _preset=name)
+        await ctx.send(embed=embed)
+
     @commands.command(name='history')
     async def _history(self, ctx):
         """Show the last 10 songs played."""
@@ -666,51 +687,51 @@ class Music(commands.Cog):
         # Define an internal function to make requests to the Genius API
         async def get_site_content(url: str, scrape: bool = False) -> Optional[dict | str]:
             header = {} if scrape else {'Authorization': f'Bearer {genius_access_token}'}
-            async with self.bot.session.get(url, headers=header) as r:
-                if r.status != 200:
-                    embed = discord.Embed(description=ctx.localizer.format_str('{errors.error_occurred}'),
-                                          color=0xFF0000)
-                    await status_msg.edit(embed=embed)
-                    return
-                if scrape:
-                    return await r.text()
-                return await r.json()
-
-        # Query the song
-        url = 'https://api.genius.com/search?' + urlparse.urlencode({'q': query})
-        response = await get_site_content(url)
-        if not response:
-            return
-
-        # Select top song result
-        try:
-            song = {}
-            for hit in response['response']['hits']:
-                if hit['type'] == 'song':
-                    song = hit['result']
-                    break
-            song_url = song['url']
-        except KeyError:
-            embed = discord.Embed(description=ctx.localizer.format_str('{nothing_found}'), color=0xFF0000)
-            return await status_msg.edit(embed=embed)
-
-        # Scrape the lyrics from the song page
-        response = await get_site_content(song_url, scrape=True)
-        if not response:
-            return
+            response = await self.bot.http_client.get(url, headers=header)
+            if response.status != 200:
+                embed = discord.Embed(description=ctx.localizer.format_str('{errors.error_occurred}'),
+                                      color=0xFF0000)
+                await status_msg.edit(embed=embed)
+                return
+            if scrape:
+                return response.text()
+            return response.json()
+
+        # Query the song, unless it was found recently
+        if (song := self.lyrics_cache.get_song(query)) is None:
+            url = 'https://api.genius.com/search?' + urlparse.urlencode({'q': query})
+            response = await get_site_content(url)
+            if not response:
+                return
 
-        # Find the lyrics in our scraped data
-        scraped_data = BeautifulSoup(response, 'html.parser')
-        lyrics = scraped_data.findAll('div')
-        for div in lyrics:
-            if div.has_attr('data-lyrics-container'):
-                lyrics_div = div
-                break  # We found the lyrics, so we can stop searching
+            # Select top song result
+            try:
+                song = {}
+                for hit in response['response']['hits']:
+                    if hit['type'] == 'song':
+                        song = hit['result']
+                        break
+                song_url = song['url']
+            except KeyError:
+                embed = discord.Embed(description=ctx.localizer.format_str('{nothing_found}'), color=0xFF0000)
+                return await status_msg.edit(embed=embed)
+
+            # Only keep what we show
+            song = {key: song[key] for key in ('id', 'url', 'full_title', 'header_image_thumbnail_url') if key in song}
+            self.lyrics_cache.set_song(query, song)
+        song_url = song['url']
+
+        if (lyrics := self.lyrics_cache.get_lyrics(song.get('id', song_url))) is None:
+            # Scrape the lyrics from the song page
+            response = await get_site_content(song_url, scrape=True)
+            if not response:
+                return
 
-        # Replace <br> tags with newlines and remove HTML tags
-        # This is a bit hacky, but it works
-        lyrics = re.sub(r'<br\s*/>', '\n', str(lyrics_div))
-        lyrics = re.sub(r'<\/*\w+.*>', '', lyrics)
+            # Find the lyrics in our scraped data
+            if not (lyrics := await extract_lyrics(response)):
+                embed = discord.Embed(description=ctx.localizer.format_str('{nothing_found}'), color=0xFF0000)
+                return await status_msg.edit(embed=embed)
+            self.lyrics_cache.set_lyrics(song.get('id', song_url), lyrics)
 
         # Construct the output embed
         paginator = TextPaginator(max_size=2000, max_lines=50, color=0xFFFF64)
@@ -805,30 +826,22 @@ class Music(commands.Cog):
 
     async def cog_unload(self):
         self.lavalink._event_hooks.clear()
+        self.lyrics_cache.close()
+        self.vote_sessions.close_all()
+
+    async def on_track_end(self, event: TrackEndEvent):
+        event.player.skip_voters.clear()
 
-    async def track_hook(self, event):
-        if isinstance(event, TrackEndEvent):
-            if channel := self.bot.get_channel(event.player.fetch('channel')):
-                if isinstance(channel, VoiceChannel):
-                    player = self.get_player(channel.guild)
-                    player.skip_voters.clear()
-
-        if isinstance(event, TrackStartEvent):
-            pass
-        if isinstance(event, QueueEndEvent):
-            if channel := self.bot.get_channel(event.player.fetch('channel')):
-                if isinstance(channel, VoiceChannel):
-                    await self.check_leave_voice(channel.guild)
-        if isinstance(event, PlayerUpdateEvent):
-            pass
-        if isinstance(event, NodeDisconnectedEvent):
-            pass
-        if isinstance(event, NodeConnectedEvent):
-            pass
-        if isinstance(event, NodeChangedEvent):
-            pass
-        if isinstance(event, TrackStuckEvent):
-            pass
+    async def on_queue_end(self, event: QueueEndEvent):
+        if channel := self.bot.get_channel(event.player.fetch('channel')):
+            if isinstance(channel, VoiceChannel):
+                await self.check_leave_voice(channel.guild)
+
+    @commands.Cog.listener()
+    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
+        """Feeds reactions to the open votes."""
+        if payload.message_id in self.vote_sessions:
+            await self.vote_sessions.handle_reaction(payload)
 
     @commands.Cog.listener()
     async def on_voice_state_update(self, member: discord.Member, _: discord.VoiceState, after: discord.VoiceState):
@@ -842,10 +855,7 @@ class Music(commands.Cog):
                 player = self.get_player(member.guild)
             except PlayerNotAvailableError:  # This is expected if we have not created a player for the guild yet
                 return
-            player.clear_listeners()
-            for member in voice_channel.members:
-                if not member.bot:
-                    player.update_listeners(member, member.voice)
+            player.join_listeners(voice_channel)
 
         if member.id == self.bot.user.id and after.channel is None:
             voice_client: BasicVoiceClient
@@ -857,14 +867,14 @@ class Music(commands.Cog):
                 player = self.get_player(member.guild)
             except PlayerNotAvailableError:  # This is expected if we have not created a player for the guild yet
                 return
-            player.update_listeners(member, after)
-            await self.check_leave_voice(member.guild)
+            if player.update_listeners(member, after) and player.listener_count == 0:
+                await self.check_leave_voice(member.guild)
 
     async def check_leave_voice(self, guild: discord.Guild):
         """Checks if the bot should leave the voice channel."""
         # TODO, disconnect timer?
         player = self.get_player(guild)
-        if len(player.listeners) == 0 and player.is_connected:
+        if player.listener_count == 0 and player.is_connected:
             if player.queue.empty and player.current is None:
                 await player.stop()
                 voice_client: BasicVoiceClient
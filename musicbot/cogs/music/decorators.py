@@ -1,12 +1,12 @@
-import asyncio
 import functools
 import inspect
-import math
 
 import discord
+from discord.ext import commands
 
 from musicbot.utils.checks import is_dj
 from musicbot.utils.mixplayer.player import MixPlayer
+from musicbot.utils.userinteraction.edit_coalescer import EditCoalescer
 
 from . import music_errors
 from .voice_client import BasicVoiceClient
@@ -135,13 +135,12 @@ def voteable(requester_override=False, DJ_override=False, react_to_vote=False):
         @functools.wraps(func)
         async def voteable_inner(self, ctx, *command_args, **kwargs):
             player = self.bot.lavalink.player_manager.get(ctx.guild.id)
-            player.add_vote(func.__name__, ctx.author)
+            category = func.__name__
+            player.votes.set_threshold(self.bot.settings.get(ctx.guild, 'vote_threshold', 'default_threshold'))
+            player.add_vote(category, ctx.author)
 
-            total = len(player.listeners)
-            votes = len(player.get_voters(func.__name__))
-            threshold = self.bot.settings.get(ctx.guild, 'vote_threshold', 'default_threshold')
-
-            enough_votes = votes/total >= threshold/100
+            votes = player.votes.count(category)
+            enough_votes = player.votes.enough(category)
             DJ = DJ_override and is_dj(ctx)
             requester = player.current is None or (player.current.requester == ctx.author.id and requester_override)
 
@@ -151,51 +150,53 @@ def voteable(requester_override=False, DJ_override=False, react_to_vote=False):
 
             elif react_to_vote:
                 embed = discord.Embed(title="Votes",
-                                      description=f"{votes} out of {math.ceil(total*threshold/100)} required votes.",
+                                      description=f"{votes} out of {player.votes.required} required votes.",
                                       color=ctx.me.color)
                 embed.set_footer(text=f'{{requested_by}} {ctx.author.name}', icon_url=ctx.author.display_avatar.url)
                 msg = await ctx.send(embed=ctx.localizer.format_embed(embed))
                 await msg.add_reaction('👍')
 
-                def check(reaction, user):
-                    if not reaction.message.id == msg.id:
-                        return False
+                async def edit_votes():
+                    embed.description = f"{player.votes.count(category)} out of {player.votes.required} required votes."
+                    await msg.edit(embed=ctx.localizer.format_embed(embed))
+                edits = EditCoalescer(edit_votes)
 
-                    if user is None or user not in player.listeners:
+                async def on_vote(member: discord.Member) -> bool:
+                    if not player.add_vote(category, member):
                         return False
-
-                    if reaction.emoji == '👍' and user.id not in player.get_voters(func.__name__):
-                        player.add_vote(func.__name__, user)
+                    if not player.votes.enough(category):
+                        edits.request()
                         return True
-                    return False
-
-                while True:
+                    # Closed before awaiting anything, later reactions can not run the command again
+                    self.vote_sessions.close(msg.id)
+                    await edits.cancel()
+                    player.clear_votes()
                     try:
-                        reaction, user = await self.bot.wait_for('reaction_add', timeout=15.0, check=check)
-                    except asyncio.TimeoutError:
-                        await msg.clear_reactions()
-                        embed.title = ''
-                        embed.set_footer(text='{time_expired}')
-                        await msg.edit(embed=ctx.localizer.format_embed(embed))
-                        break
-
-                    total = len(player.listeners)
-                    votes = len(player.get_voters(func.__name__))
-
-                    embed.description = f"{votes} out of {math.ceil(total*threshold/100)} required votes."
-                    await msg.edit(embed=ctx.localizer.format_embed(embed))
-
-                    if votes/total >= threshold/100:
-                        player.clear_votes()
                         await msg.delete()
+                    except discord.HTTPException:
+                        pass  # The vote message may be deleted already
+                    # Errors are reported like those of the command when it runs without a vote
+                    try:
                         await func(self, ctx, *command_args, **kwargs)
-                        break
+                    except commands.CommandError as err:
+                        self.bot.dispatch('command_error', ctx, err)
+                    except Exception as err:
+                        self.bot.dispatch('command_error', ctx, commands.CommandInvokeError(err))
+                    return True
+
+                async def on_timeout():
+                    await edits.cancel()
+                    await msg.clear_reactions()
+                    embed.title = ''
+                    embed.set_footer(text='{time_expired}')
+                    await msg.edit(embed=ctx.localizer.format_embed(embed))
+
+                self.vote_sessions.open(msg.id, on_vote, on_timeout, emoji='👍', timeout=15.0)
 
             else:
                 if votes != 0:
-                    needed = math.ceil(total*threshold/100)
                     # TODO: redo this message to allow for other vote types
-                    msg = ctx.localizer.format_str("{skip.require_vote}", _skips=votes, _total=needed)
+                    msg = ctx.localizer.format_str("{skip.require_vote}", _skips=votes, _total=player.votes.required)
                     await ctx.send(msg)
 
         return voteable_inner
@@ -3,8 +3,11 @@ from typing import Optional
 import discord
 from discord.ext import commands
 
+import yaml
+
 from bot import MusicBot
 from musicbot.utils import checks
+from musicbot.utils.mixplayer.presets import PRESET_NAME, build_preset, parse_description
 from musicbot.utils.settingsmanager import Settings as SettingsManager
 from musicbot.utils.userinteraction import ClearMode, Scroller
 
@@ -36,10 +39,10 @@ class Settings(commands.Cog):
     @commands.guild_only()
     @_set.command(name='serverlocale')
     async def _set_guild_locale(self, ctx, locale):
-        self.bot.localizer.index_localizations()
-        self.bot.aliaser.index_localizations()
-        self.bot.localizer.load_localizations()
-        self.bot.aliaser.load_localizations()
+        if locale not in self.bot.aliaser.localization_table.keys():
+            # The locale may have been added since the localization folder was last checked
+            await self.bot.localizer.reload()
+            await self.bot.aliaser.reload()
 
         if locale in self.bot.aliaser.localization_table.keys():
             self.settings.set(ctx.guild, 'locale', locale)
@@ -54,6 +57,7 @@ class Settings(commands.Cog):
     async def _set_guild_prefix(self, ctx, *prefixes):
         if prefixes := list(prefixes):
             self.settings.set(ctx.guild, 'prefixes', prefixes)
+            self.bot.invalidate_guild_prefixes(ctx.guild)
         prefixes = self.settings.get(ctx.guild, 'prefixes')
         await ctx.send(f'Server prefixes: {self.format_prefixes(prefixes)}')
 
@@ -62,6 +66,7 @@ class Settings(commands.Cog):
     @_set.command(name='resetprefix')
     async def _reset_prefix(self, ctx):
         self.settings.set(ctx.guild, 'prefixes', None)
+        self.bot.invalidate_guild_prefixes(ctx.guild)
         prefixes = self.settings.get(ctx.guild, 'prefixes', 'default_prefix')
         await ctx.send(self.format_prefixes(prefixes))
 
@@ -82,6 +87,26 @@ class Settings(commands.Cog):
         threshold = self.bot.settings.get(ctx.guild, 'vote_threshold', 50)
         await ctx.send(f'Vote threshold set to {threshold}%')
 
+    @checks.is_admin()
+    @commands.guild_only()
+    @_set.command(name='preset')
+    async def set_filter_preset(self, ctx, name: str, *, filters: Optional[str] = None):
+        name = name.lower()
+        if filters is None:
+            if not PRESET_NAME.match(name) or self.bot.settings.get(ctx.guild, f'filter_presets.{name}') is None:
+                return await ctx.send(f'There is no preset called `{name}` on this server')
+            self.bot.settings.set(ctx.guild, f'filter_presets.{name}', None)
+            return await ctx.send(f'Filter preset `{name}` removed')
+
+        try:
+            description = parse_description(filters)
+            build_preset(name, description)
+        except (yaml.YAMLError, ValueError) as err:
+            return await ctx.send(f'Invalid preset: {err}')
+
+        self.bot.settings.set(ctx.guild, f'filter_presets.{name}', description)
+        await ctx.send(f'Filter preset `{name}` saved')
+
     @checks.is_admin()
     @commands.guild_only()
     @_set.command(name='textchannels')
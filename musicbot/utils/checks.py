@@ -1,3 +1,5 @@
+from typing import Tuple
+
 import discord
 from discord.ext import commands
 
@@ -57,17 +59,34 @@ def is_dj(ctx):
         return any([has_role_id(ctx, role_id) for role_id in dj_role_ids])
 
 
-def dj_or(alone: bool = False, track_requester: bool = False):
-    async def predicate(ctx):
-        try:
-            player = ctx.bot.lavalink.player_manager.get(ctx.guild.id)
-            is_alone = (ctx.author in player.listeners and len(player.listeners) == 1) and alone
-            requester = (player.current.requester == ctx.author.id) and track_requester
+def player_standing(ctx) -> Tuple[bool, bool]:
+    """Whether the author is alone with the bot and whether they requested the current track."""
+    try:
+        player = ctx.bot.lavalink.player_manager.get(ctx.guild.id)
+        is_alone = ctx.author in player.listeners and len(player.listeners) == 1
+        requester = player.current.requester == ctx.author.id
+    except AttributeError:
+        return False, False
+    return is_alone, requester
 
-        except AttributeError:
-            requester = False
-            is_alone = False
 
+def dj_or(alone: bool = False, track_requester: bool = False):
+    async def predicate(ctx):
+        is_alone, requester = player_standing(ctx)
         dj = is_dj(ctx)
-        return dj or is_alone or requester
+        return dj or (is_alone and alone) or (requester and track_requester)
     return commands.check(predicate)
+
+
+async def permission_profile(ctx) -> Tuple[bool, ...]:
+    """
+    Outcome of every kind of check the commands use, for the author in this context.
+    Two contexts with the same profile can run the same commands.
+    """
+    is_owner = await ctx.bot.is_owner(ctx.author)
+    if ctx.guild is None:
+        return False, is_owner
+    is_admin = is_owner or ctx.author.guild_permissions.administrator
+    textchannels = ctx.bot.settings.get(ctx.guild, 'channels.text', [])
+    in_textchannel = not textchannels or ctx.channel.id in textchannels
+    return (True, is_owner, is_admin, in_textchannel, is_dj(ctx), *player_standing(ctx))
@@ -0,0 +1,130 @@
+import asyncio
+import json
+import logging
+import random
+import time
+from typing import Any, Dict, Mapping, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+"""
+The HTTP client used for every outbound request of the bot, except those made by discord.py and lavalink.
+Connections are pooled, requests to a host are limited, and failed requests are retried with backoff.
+"""
+
+# Statuses worth trying again, the request may succeed a little later
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRY_DELAY = 10.0
+
+
+class HttpResponse(NamedTuple):
+    status: int
+    headers: Mapping[str, str]  # case insensitive
+    body: bytes
+    charset: Optional[str]
+
+    def text(self) -> str:
+        return self.body.decode(self.charset or 'utf-8', errors='replace')
+
+    def json(self) -> Any:
+        return json.loads(self.text())
+
+
+class HostStats:
+    """Request timing of a host."""
+    __slots__ = ('requests', 'retries', 'failures', 'total_time', 'max_time')
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    @property
+    def average_time(self) -> float:
+        return self.total_time / self.requests if self.requests else 0.0
+
+    def __repr__(self):
+        return (f'<HostStats requests={self.requests} retries={self.retries} failures={self.failures} '
+                f'average={self.average_time * 1000:.0f}ms max={self.max_time * 1000:.0f}ms>')
+
+
+class HttpClient:
+    def __init__(self, max_connections: int = 100, max_per_host: int = 8, dns_cache_ttl: int = 300,
+                 timeout: float = 10.0, connect_timeout: float = 3.0, retries: int = 2, backoff: float = 0.5):
+        """Must be created while the event loop is running, e.g. in setup_hook."""
+        self.logger = logging.getLogger("musicbot").getChild("HttpClient")
+        self.max_per_host = max_per_host
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = aiohttp.ClientTimeout(total=timeout, connect=connect_timeout)
+
+        connector = aiohttp.TCPConnector(limit=max_connections, limit_per_host=max_per_host,
+                                         use_dns_cache=True, ttl_dns_cache=dns_cache_ttl)
+        self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self.stats: Dict[str, HostStats] = {}
+
+    def _host_limit(self, host) -> asyncio.Semaphore:
+        if (limit := self._host_limits.get(host)) is None:
+            limit = self._host_limits[host] = asyncio.Semaphore(self.max_per_host)
+        return limit
+
+    def _retry_delay(self, attempt, response: Optional[HttpResponse] = None) -> float:
+        if response is not None and (retry_after := response.headers.get('Retry-After', '')).isdigit():
+            return min(float(retry_after), MAX_RETRY_DELAY)
+        return min(self.backoff * 2 ** attempt + random.uniform(0, self.backoff), MAX_RETRY_DELAY)
+
+    async def _send(self, method, url, timeout, **kwargs) -> HttpResponse:
+        async with self.session.request(method, url, timeout=timeout, **kwargs) as response:
+            body = await response.read()
+            return HttpResponse(response.status, response.headers, body, response.charset)
+
+    async def request(self, method: str, url: str, *, timeout: Optional[float] = None,
+                      retries: Optional[int] = None, **kwargs) -> HttpResponse:
+        """
+        Sends a request and reads the whole response. Connection errors, timeouts and statuses in RETRY_STATUSES are
+        retried, the last response is returned or the last error raised when out of retries.
+        """
+        host = urlsplit(url).hostname or ''
+        stats = self.stats.setdefault(host, HostStats())
+        client_timeout = aiohttp.ClientTimeout(total=timeout) if timeout is not None else self.timeout
+        retries = self.retries if retries is None else retries
+
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                async with self._host_limit(host):
+                    response = await self._send(method, url, client_timeout, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as err:
+                response, error = None, err
+            else:
+                error = None
+            elapsed = time.perf_counter() - start
+
+            stats.requests += 1
+            stats.total_time += elapsed
+            stats.max_time = max(stats.max_time, elapsed)
+            status = response.status if response is not None else type(error).__name__
+            self.logger.debug("%s %s: %s in %.0f ms", method, url, status, elapsed * 1000)
+
+            if error is None and response.status not in RETRY_STATUSES:
+                return response
+            if attempt >= retries:
+                stats.failures += 1
+                if error is not None:
+                    raise error
+                return response
+
+            stats.retries += 1
+            await asyncio.sleep(self._retry_delay(attempt, response))
+            attempt += 1
+
+    async def get(self, url: str, **kwargs) -> HttpResponse:
+        return await self.request('GET', url, **kwargs)
+
+    async def close(self):
+        await self.session.close()
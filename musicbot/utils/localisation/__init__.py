@@ -1,5 +1,6 @@
 from .alias import Aliaser
+from .filecache import ParsedFileCache
 from .localizedcontext import LocalizedContext
 from .localizer import Localizer, LocalizerWrapper
 
-__all__ = ['Aliaser', 'LocalizerWrapper', 'Localizer', 'LocalizedContext']
+__all__ = ['Aliaser', 'LocalizerWrapper', 'Localizer', 'LocalizedContext', 'ParsedFileCache']
@@ -1,9 +1,10 @@
-from glob import glob
 from os import path
+from typing import Dict, Optional, Tuple
 
 from discord.ext import commands
 
-import yaml
+from .filecache import ParsedFileCache
+from .loader import LocalizationLoader
 
 """
 Not the prettiest this, works by replacing any found aliases in a command string with the actual command names.
@@ -12,69 +13,60 @@ ways of doing this appreciated.
 """
 
 
-class Aliaser:
-    def __init__(self, localization_folder, default_lang):
-        self.localization_folder = path.realpath(localization_folder)
-        self.default_lang = default_lang
-        self.index_localizations()
-        self.load_localizations()
+class AliasNode:
+    """A level of the alias trie, the aliases of the commands at this level and the levels of their subcommands."""
+    __slots__ = ('commands', 'sub_commands')
 
-    def _gen_alias_dict(self, commands):
-        """Reverses the direction of a dict of commans→aliases to be alias→command."""
-        inverted = {}
-        subcommands = {}
-        for cmd, properties in commands.items():
+    def __init__(self, aliases: dict):
+        self.commands: Dict[str, str] = {}  # alias → command
+        self.sub_commands: Dict[str, AliasNode] = {}  # command → level of its subcommands
+        for cmd, properties in aliases.items():
             if isinstance(properties, list):
                 for alias in properties:
-                    inverted[alias] = cmd
+                    self.commands[alias] = cmd
             else:
                 for alias in properties['aliases']:
-                    inverted[alias] = cmd
+                    self.commands[alias] = cmd
                 if properties.get('sub_commands', None):
-                    subcommands[cmd] = self._gen_alias_dict(properties['sub_commands'])
-        inverted['sub_commands'] = subcommands
-        return inverted
-
-    def index_localizations(self):
-        self.localization_table = {}
-        for folder in glob(path.join(self.localization_folder, "*/")):
-            if 'global' in folder:
-                continue
-            folder_base = path.basename(path.dirname(folder))
-            self.localization_table[folder_base] = False
-
-    def load_localizations(self):
-        for lang in self.localization_table.keys():
-            with open(path.join(self.localization_folder, lang, "commands.yaml"), "r", encoding='utf-8') as f:
-                data = yaml.load(f, Loader=yaml.SafeLoader)
-            self.localization_table[lang] = {'aliases': data, 'commands': self._gen_alias_dict(data)}
+                    self.sub_commands[cmd] = AliasNode(properties['sub_commands'])
 
-    def convert_alias(self, locale, default=None, parents=None):
-        if parents is None:
-            parents = []
+    def resolve(self, alias) -> Tuple[str, Optional['AliasNode']]:
+        """Returns the command an alias is for, or the alias itself if it isn't one, and the level below it."""
+        command = self.commands.get(alias, alias)
+        return command, self.sub_commands.get(command, None)
+
+
+class Aliaser(LocalizationLoader):
+    def __init__(self, localization_folder, default_lang, file_cache: Optional[ParsedFileCache] = None):
+        super().__init__(localization_folder, file_cache)
+        self.default_lang = default_lang
+        self.index_localizations()
+        self.load_localizations()
+
+    def _available_localizations(self):
+        return super()._available_localizations() - {'global'}
+
+    def _localization_files(self, lang):
+        return [path.join(self.localization_folder, lang, "commands.yaml")]
+
+    def _read_localization(self, lang):
+        data = self.file_cache.load_yaml(path.join(self.localization_folder, lang, "commands.yaml"))
+        return {'aliases': data, 'commands': AliasNode(data)}
+
+    def _alias_node(self, locale, parents=()) -> Optional[AliasNode]:
+        """The level of the alias trie below the given parent commands."""
         try:
-            locale = self.localization_table[locale]
+            node = self.localization_table[locale]['commands']
         except KeyError:
-            locale = self.localization_table[self.default_lang]
-
-        # Traverse through the alias tree as dictated by the parents list
-        def traverse(alias_tree, parents, alias):
-            # Return the command when no more parents exist
-            if not parents:
-                return alias_tree.get(alias, None)
-            parent = parents.pop(0)
-            sub_commands = alias_tree.get('sub_commands', None)
-            if not sub_commands:
-                return None
-            alias_tree = sub_commands.get(parent, None)
-            if not alias_tree:
-                return None
-            return traverse(alias_tree, parents, alias)
+            node = self.localization_table[self.default_lang]['commands']
+        for parent in parents:
+            if (node := node.sub_commands.get(parent, None)) is None:
+                break
+        return node
 
-        alias_tree = locale['commands']
-        command = traverse(alias_tree, parents, default)
-        if command:
-            return command
+    def convert_alias(self, locale, default=None, parents=None):
+        if node := self._alias_node(locale, parents or ()):
+            return node.commands.get(default, default)
         return default
 
     def get_cmd_help(self, locale, command=None, parents=None):
@@ -109,53 +101,48 @@ class Aliaser:
         ctx.view.undo()
         ctx.invoker = ctx.view.buffer[ctx.view.index:ctx.view.end]
         alias = ctx.view.get_word()
-        command = self.convert_alias(ctx.locale, alias)
+        command, node = self._alias_node(ctx.locale).resolve(alias)
         ctx.invoked_with = command
         ctx.command = ctx.bot.all_commands.get(command)
         if ctx.command and isinstance(ctx.command, commands.GroupMixin):
-            ctx = self.get_subcommand(ctx, ctx.command, [str(ctx.command)])
+            self._replace_aliases(ctx.view, node, ctx.command.all_commands)
         return ctx
 
-    def _replace_command(self, view, index, alias, command):
-        buf = view.buffer
-        changed = buf[index:]
-        view.buffer = buf[:index] + changed.replace(alias, command, 1)
-        return view
-
     def get_subcommand(self, ctx, group=None, parents=None):
-        """Recursicely replaces all subcommand aliases with subcommands."""
-        if parents is None:
-            parents = []
-        view = ctx.view
-        prev = view.previous
-        idx = view.index
-
-        # get the alias used
-        view.skip_ws()
-        alias = view.get_word()
-
-        sub_command = self.convert_alias(ctx.locale, alias, parents.copy())
-        parents.append(sub_command)
-
-        # Replace the alias in the command
-        self._replace_command(view, idx, alias, sub_command)
-
-        # Update the view to account for difference in length
-        strdiff = len(sub_command) - len(alias)
-        view.end += strdiff
-        view.index += strdiff
-
-        # Get the subcommand
-        if group:
-            sub = group.all_commands.get(sub_command, None)
-        else:
-            sub = ctx.bot.all_commands.get(sub_command, None)
-
-        # Translate any subsubcommands
-        if sub and isinstance(sub, commands.GroupMixin):
-            self.get_subcommand(ctx, sub, parents)
-
-        # Reset the view indexes
-        view.index = idx
-        view.previous = prev
+        """Replaces all subcommand aliases following the view position with subcommands."""
+        node = self._alias_node(ctx.locale, parents or ())
+        self._replace_aliases(ctx.view, node, group.all_commands if group else ctx.bot.all_commands)
         return ctx
+
+    @staticmethod
+    def _replace_aliases(view, node: Optional[AliasNode], command_table):
+        """
+        Walks the words following the view position down the alias trie and the command tree at the same time,
+        replacing aliases with the command names. The buffer is rewritten once and the view position is kept.
+        """
+        index, previous = view.index, view.previous
+        replacements = []
+        while command_table is not None:
+            view.skip_ws()
+            start = view.index
+            alias = view.get_word()
+            command, node = node.resolve(alias) if node else (alias, None)
+            if command != alias:
+                replacements.append((start, view.index, command))
+            sub = command_table.get(command, None)
+            command_table = sub.all_commands if isinstance(sub, commands.GroupMixin) else None
+
+        if replacements:
+            buf = view.buffer
+            parts = []
+            last = 0
+            for start, end, command in replacements:
+                parts.append(buf[last:start])
+                parts.append(command)
+                last = end
+            parts.append(buf[last:])
+            view.buffer = ''.join(parts)
+            view.end += len(view.buffer) - len(buf)
+
+        view.index = index
+        view.previous = previous
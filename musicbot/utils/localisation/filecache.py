@@ -0,0 +1,101 @@
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import yaml
+
+"""
+Cache of parsed localization files, kept on disk so the bot does not have to parse every YAML file on startup.
+Files are only parsed again when their modification time or size changes.
+"""
+
+# Use the much faster libyaml based loader if pyyaml was built with it
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+CACHE_VERSION = 1
+
+Signature = Tuple[int, int]  # (modification time in ns, size)
+
+
+def file_signatures(files: Iterable[str]) -> Dict[str, Signature]:
+    """Signatures of the given files by real path, files that do not exist (anymore) are left out."""
+    signatures = {}
+    for file in files:
+        file = os.path.realpath(file)
+        try:
+            signatures[file] = ParsedFileCache._signature(file)
+        except FileNotFoundError:
+            continue
+    return signatures
+
+
+class ParsedFileCache:
+    def __init__(self, cache_path: Optional[str] = None):
+        """cache_path: where to keep the cache between runs, in memory only if None."""
+        self.cache_path = cache_path
+        self.logger = logging.getLogger("musicbot").getChild("LocalizationCache")
+        self._entries: Dict[str, Tuple[Signature, Any]] = {}
+        self._changed = False
+        # Localizations are reloaded in a worker thread while the bot keeps running
+        self._lock = threading.Lock()
+
+        if self.cache_path and os.path.isfile(self.cache_path):
+            try:
+                with open(self.cache_path, 'rb') as f:
+                    cached = pickle.load(f)
+                if cached.get('version') == CACHE_VERSION:
+                    self._entries = cached['files']
+            except Exception:
+                self.logger.exception("Could not read localization cache %s, rebuilding it" % self.cache_path)
+
+    @staticmethod
+    def _signature(file) -> Signature:
+        stat = os.stat(file)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self, file, parse) -> Any:
+        file = os.path.realpath(file)
+        signature = self._signature(file)
+        if (entry := self._entries.get(file)) and entry[0] == signature:
+            return entry[1]
+
+        with open(file, "r", encoding='utf-8') as f:
+            data = parse(f)
+        with self._lock:
+            self._entries[file] = (signature, data)
+            self._changed = True
+        return data
+
+    def load_yaml(self, file) -> Any:
+        return self._load(file, lambda f: yaml.load(f, Loader=YamlLoader))
+
+    def load_text(self, file) -> str:
+        return self._load(file, lambda f: f.read())
+
+    def save(self):
+        """Writes the cache to disk if anything was parsed since it was loaded."""
+        with self._lock:
+            self._save()
+
+    def _save(self):
+        if not self.cache_path or not self._changed:
+            return
+
+        # Forget files that have been removed
+        self._entries = {file: entry for file, entry in self._entries.items() if os.path.isfile(file)}
+
+        directory = os.path.dirname(os.path.realpath(self.cache_path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.localization.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump({'version': CACHE_VERSION, 'files': self._entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+            self._changed = False
+        except Exception:
+            self.logger.exception("Could not write localization cache %s" % self.cache_path)
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
@@ -0,0 +1,101 @@
+import asyncio
+from abc import ABC, abstractmethod
+from glob import glob
+from os import path
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from .filecache import ParsedFileCache, Signature, file_signatures
+
+"""
+Loading of per language tables from the localization folder. Only languages whose files changed are read again when
+reloading, the new tables are built off the event loop and swapped in at once, so commands never see a half loaded
+localization.
+"""
+
+
+class LoadedLocalizations(NamedTuple):
+    sources: Dict[str, Dict[str, Signature]]  # files read per language, with the signature they had when read
+    raw_tables: Dict[str, Any]  # per language, as read from the files
+    tables: Dict[str, Any]  # per language, ready for use
+
+
+class LocalizationLoader(ABC):
+    def __init__(self, localization_folder, file_cache: Optional[ParsedFileCache] = None):
+        self.localization_folder = path.realpath(localization_folder)
+        self.file_cache = file_cache or ParsedFileCache()
+        self.localization_table: Dict[str, Any] = {}
+        self._raw_tables: Dict[str, Any] = {}
+        self._sources: Dict[str, Dict[str, Signature]] = {}
+        self._reload_lock = asyncio.Lock()
+
+    def _available_localizations(self) -> Set[str]:
+        """Names of the language folders in the localization folder."""
+        return {path.basename(path.dirname(folder)) for folder in glob(path.join(self.localization_folder, "*/"))}
+
+    @abstractmethod
+    def _localization_files(self, lang) -> List[str]:
+        """Files a language is read from."""
+
+    @abstractmethod
+    def _read_localization(self, lang) -> Any:
+        """Reads the files of a language into its raw table."""
+
+    def _build_tables(self, raw_tables: Dict[str, Any]) -> Dict[str, Any]:
+        """Turns the raw tables of all languages into the tables used by the bot."""
+        return dict(raw_tables)
+
+    def _read_with_sources(self, lang) -> Tuple[Any, Dict[str, Signature]]:
+        # Signatures are taken before reading, a file changed while being read is picked up by the next reload
+        signatures = file_signatures(self._localization_files(lang))
+        return self._read_localization(lang), signatures
+
+    def index_localizations(self):
+        """Marks all languages in the localization folder as not loaded."""
+        self.localization_table = {lang: False for lang in sorted(self._available_localizations())}
+
+    def load_localizations(self):
+        """Reads and swaps in every language."""
+        self._swap_localizations(self.build_localizations())
+
+    def changed_localizations(self) -> Set[str]:
+        """Languages added, removed or with files changed since they were loaded."""
+        available = self._available_localizations()
+        changed = available ^ self._sources.keys()
+        for lang in available & self._sources.keys():
+            if file_signatures(self._localization_files(lang)) != self._sources[lang]:
+                changed.add(lang)
+        return changed
+
+    def build_localizations(self, langs: Optional[Set[str]] = None) -> LoadedLocalizations:
+        """
+        Reads the given languages again, all if None, and builds the tables of every language.
+        Languages that are not loaded yet are read as well. Does not touch the loaded tables, safe to run in a thread.
+        """
+        available = self._available_localizations()
+        reread = available if langs is None else langs
+        sources = {lang: files for lang, files in self._sources.items() if lang in available and lang not in reread}
+        raw_tables = {lang: self._raw_tables[lang] for lang in sources}
+
+        for lang in sorted(available - sources.keys()):
+            raw_tables[lang], sources[lang] = self._read_with_sources(lang)
+        self.file_cache.save()
+
+        return LoadedLocalizations(sources, raw_tables, self._build_tables(raw_tables))
+
+    def _swap_localizations(self, loaded: LoadedLocalizations):
+        self._sources = loaded.sources
+        self._raw_tables = loaded.raw_tables
+        self.localization_table = loaded.tables
+
+    async def reload(self, changed_only=True) -> Set[str]:
+        """Reloads localizations without blocking the event loop. Returns the languages that were reloaded."""
+        async with self._reload_lock:
+            if changed_only:
+                langs = await asyncio.to_thread(self.changed_localizations)
+                if not langs:
+                    return langs
+            else:
+                langs = None
+            loaded = await asyncio.to_thread(self.build_localizations, langs)
+            self._swap_localizations(loaded)
+            return set(loaded.tables) if langs is None else langs
@@ -0,0 +1,36 @@
+import copy
+from typing import Optional, Tuple
+
+from discord import Embed
+
+"""
+Access to the localizable text of an embed: title, description, footer text, author name and field names and values.
+The text is a flat tuple: (title, description, footer, author, field 1 name, field 1 value, field 2 name, ...)
+"""
+
+EmbedText = Tuple[Optional[str], ...]
+
+
+def get_embed_text(embed: Embed) -> EmbedText:
+    footer = getattr(embed, '_footer', None) or {}
+    author = getattr(embed, '_author', None) or {}
+    text = [embed.title, embed.description, footer.get('text'), author.get('name')]
+    for field in getattr(embed, '_fields', None) or []:
+        text.append(field.get('name'))
+        text.append(field.get('value'))
+    return tuple(text)
+
+
+def with_embed_text(embed: Embed, text: EmbedText) -> Embed:
+    """Returns a copy of the embed with the text replaced. Only the parts of the embed holding text are copied."""
+    new = copy.copy(embed)
+    new.title, new.description = text[0], text[1]
+
+    if (footer := getattr(embed, '_footer', None)) and 'text' in footer:
+        new._footer = {**footer, 'text': text[2]}
+    if (author := getattr(embed, '_author', None)) and 'name' in author:
+        new._author = {**author, 'name': text[3]}
+    if (fields := getattr(embed, '_fields', None)) is not None:
+        new._fields = [{**field, 'name': name, 'value': value}
+                       for field, name, value in zip(fields, text[4::2], text[5::2], strict=True)]
+    return new
@@ -1,47 +1,48 @@
 import copy
-import re
+import logging
+from functools import lru_cache
 from glob import glob
 from os import path
+from typing import Optional
 
-from discord import Embed
-
-import yaml
-
+from ..filecache import ParsedFileCache
+from ..loader import LocalizationLoader
 from .dict_utils import SafeDict, flatten
+from .embed_text import EmbedText, get_embed_text, with_embed_text
+from .resolver import LocalizationResolver, kmatch
+from .template import Template
 
 """
 Localizer for bot
 """
 
-kmatch = re.compile('({(?!_)([^{}]+)})')
 
-
-class Localizer:
-    def __init__(self, localization_folder, default_lang):
-        self.localization_folder = path.realpath(localization_folder)
+class Localizer(LocalizationLoader):
+    def __init__(self, localization_folder, default_lang, file_cache: Optional[ParsedFileCache] = None):
+        super().__init__(localization_folder, file_cache)
         self.default_lang = default_lang
+        self.logger = logging.getLogger("musicbot").getChild("Localizer")
+        self.all_localizations = {}
+        # Compiled format strings, most strings are formatted many times. Cleared when localizations are reloaded.
+        self._compile_template = lru_cache(maxsize=4096)(self._compile_template_uncached)
+        # Localized text of embeds formatted without placeholder values, most embeds the bot sends are like that.
+        self._format_embed_text = lru_cache(maxsize=1024)(self._format_embed_text_uncached)
         # look for localization folders
         self.index_localizations()
         # load localizations
         self.load_localizations()
 
-    # indexes localization folder
-    def index_localizations(self):
-        self.localization_table = {}
-        for folder in glob(path.join(self.localization_folder, "*/")):
-            folder_base = path.basename(path.dirname(folder))
-            self.localization_table[folder_base] = False
-
-    # loads all localizations
-    def load_localizations(self):
-        for lang in self.localization_table.keys():
-            self.localization_table[lang] = False
-            self._load_localization(lang)
+    def _build_tables(self, raw_tables):
+        resolver = LocalizationResolver(raw_tables)
+        tables = {lang: resolver.resolve(lang) for lang in raw_tables.keys()}
+        self._report_resolver_errors(resolver)
+        return tables
 
+    def _swap_localizations(self, loaded):
+        super()._swap_localizations(loaded)
         self.all_localizations = flatten(self.localization_table)
-        for lang, _ in self.localization_table.items():
-            self.localization_table[lang] = Localizer._parse_localization_dictionary(self.localization_table[lang],
-                                                                                     self.all_localizations)
+        self._compile_template.cache_clear()
+        self._format_embed_text.cache_clear()
 
     # internal function for loading a localization
     def _load_localization(self, lang):
@@ -49,40 +50,37 @@ class Localizer:
         if localization is None:
             raise Exception(f'Localization for {lang} does not exist')
         elif localization is False:
-            self.localization_table[lang] = {}
-            l_table = self.localization_table[lang]
-            for file in glob(path.join(self.localization_folder, lang, "*.yaml")):
-                if 'aliases' in file or 'commands' in file:
-                    continue
-                file_base = path.basename(file).split(".")[0]
-                with open(file, "r", encoding='utf-8') as f:
-                    data = yaml.load(f, Loader=yaml.SafeLoader)
-
-                l_table[file_base] = data
-
-            for file in glob(path.join(self.localization_folder, lang, "*.txt")):
-                file_base = path.basename(file).split(".")[0]
-                with open(file, "r", encoding='utf-8') as f:
-                    content = f.read()
-                l_table[file_base] = content
-
-            l_table = flatten(l_table)
-            # parsing a few times to resolve all values
-            for _ in range(0, 5):
-                l_table = Localizer._parse_localization_dictionary(l_table, l_table)
-
-            self.localization_table[lang] = Localizer._parse_localization_dictionary(l_table, l_table)
-
-    # parses and interpolates translation dictionary
-    @staticmethod
-    def _parse_localization_dictionary(d, lookup, prefix=None):
-        n_dict = {}
-        for k, v in d.items():
-            if isinstance(v, str):
-                n_dict[k] = Localizer._parse_localization_string(v, lookup, prefix)
+            # References to other languages can only be resolved if they are already loaded
+            tables = {other: table for other, table in self.localization_table.items() if table}
+            tables[lang], self._sources[lang] = self._read_with_sources(lang)
+            self._raw_tables[lang] = tables[lang]
+            resolver = LocalizationResolver(tables)
+            self.localization_table[lang] = resolver.resolve(lang)
+            self._report_resolver_errors(resolver)
+
+    def _localization_files(self, lang):
+        files = [file for file in glob(path.join(self.localization_folder, lang, "*.yaml"))
+                 if 'aliases' not in file and 'commands' not in file]
+        return files + glob(path.join(self.localization_folder, lang, "*.txt"))
+
+    # reads the files of a localization into a flattened table
+    def _read_localization(self, lang):
+        l_table = {}
+        for file in self._localization_files(lang):
+            file_base = path.basename(file).split(".")[0]
+            if file.endswith(".txt"):
+                l_table[file_base] = self.file_cache.load_text(file)
             else:
-                n_dict[k] = v
-        return n_dict
+                l_table[file_base] = self.file_cache.load_yaml(file)
+
+        return flatten(l_table)
+
+    def _report_resolver_errors(self, resolver):
+        for cycle in resolver.cycles:
+            self.logger.error("Localization keys reference each other in a loop: %s" %
+                              ' -> '.join(f'{lang}/{key}' for lang, key in cycle))
+        for lang, key, reference in resolver.unresolved:
+            self.logger.warning("Localization %s/%s references unknown key %s" % (lang, key, reference))
 
     @staticmethod
     def _replace_keys(value, prefix=None):
@@ -123,9 +121,12 @@ class Localizer:
         if not self.isLoaded(lang):
             self._load_localization(lang)
 
+        return self._compile_template(s, lang, prefix).format(kvpairs)
+
+    def _compile_template_uncached(self, s, lang, prefix):
         ns = Localizer._parse_localization_string(s, self.localization_table.get(lang, {}), prefix)
         ns = Localizer._parse_localization_string(ns, self.all_localizations, prefix)
-        return ns.format_map(SafeDict(kvpairs))
+        return Template(ns)
 
     # inserts translations into a values of a dictionary
     def format_dict(self, d, lang=None, prefix=None, **kvpairs):
@@ -146,7 +147,18 @@ class Localizer:
 
         return nd
 
-    # inserts translations into a values of a embed
+    # inserts translations into the text of a embed, returns a localized copy
     def format_embed(self, embed, lang=None, prefix=None, **kvpairs):
-        raw = embed.to_dict()
-        return Embed.from_dict(self.format_dict(raw, lang, prefix, **kvpairs))
+        lang = lang if lang in self.localization_table.keys() else self.default_lang
+        if not self.isLoaded(lang):
+            self._load_localization(lang)
+
+        text = get_embed_text(embed)
+        if kvpairs:
+            localized = tuple(self.format_str(s, lang, prefix, **kvpairs) if s else s for s in text)
+        else:
+            localized = self._format_embed_text(text, lang, prefix)
+        return with_embed_text(embed, localized)
+
+    def _format_embed_text_uncached(self, text: EmbedText, lang, prefix) -> EmbedText:
+        return tuple(self.format_str(s, lang, prefix) if s else s for s in text)
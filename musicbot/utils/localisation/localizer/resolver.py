@@ -0,0 +1,78 @@
+import re
+from typing import Any, Dict, List, Set, Tuple
+
+"""
+Resolves references between localization strings, e.g. "{music.now}" or "{global.vars.repo}".
+
+A reference is first looked up in the language of the string, then as "<language>.<key>" in any language.
+Every string is resolved once, after the strings it references, no matter how deep the references are nested.
+"""
+
+kmatch = re.compile('({(?!_)([^{}]+)})')
+
+Key = Tuple[str, str]  # (language, flattened key)
+
+_IN_CYCLE = object()
+
+
+class LocalizationResolver:
+    def __init__(self, tables: Dict[str, Dict[str, Any]]):
+        """tables: flattened localization tables by language, keys separated by '/'."""
+        self._tables = tables
+        self._resolved: Dict[Key, Any] = {}
+        self._resolving: Set[Key] = set()
+
+        # (language, key, reference) for references that could not be resolved
+        self.unresolved: List[Tuple[str, str, str]] = []
+        # Lists of keys referencing each other in a loop
+        self.cycles: List[List[Key]] = []
+        self._stack: List[Key] = []
+
+    def resolve(self, lang: str) -> Dict[str, Any]:
+        """Returns the table of a language with all references replaced."""
+        return {key: self._resolve_key((lang, key)) for key in self._tables[lang]}
+
+    def _find(self, lang: str, reference: str):
+        if reference in self._tables[lang]:
+            return lang, reference
+        other_lang, _, key = reference.partition('/')
+        if key in self._tables.get(other_lang, {}):
+            return other_lang, key
+        return None
+
+    def _resolve_key(self, node: Key) -> Any:
+        try:
+            return self._resolved[node]
+        except KeyError:
+            pass
+
+        lang, key = node
+        value = self._tables[lang][key]
+        if not isinstance(value, str):
+            self._resolved[node] = value
+            return value
+
+        if node in self._resolving:
+            # Leave the reference in place, the rest of the cycle is resolved as far as it can be
+            self.cycles.append(self._stack[self._stack.index(node):] + [node])
+            return _IN_CYCLE
+
+        self._resolving.add(node)
+        self._stack.append(node)
+
+        def replace(match: re.Match) -> str:
+            reference = match.group(2).replace('.', '/')
+            if (target := self._find(lang, reference)) is not None:
+                resolved = self._resolve_key(target)
+                if resolved is not _IN_CYCLE:
+                    return str(resolved)
+            else:
+                self.unresolved.append((lang, key, reference))
+            return '{' + reference + '}'
+
+        resolved = kmatch.sub(replace, value)
+
+        self._stack.pop()
+        self._resolving.discard(node)
+        self._resolved[node] = resolved
+        return resolved
@@ -0,0 +1,58 @@
+from string import Formatter
+from typing import List, Optional, Tuple
+
+from .dict_utils import SafeDict
+
+"""
+Precompiled format strings. Localization keys are looked up when the template is compiled, only the {_placeholders}
+are filled in when it is formatted.
+"""
+
+_formatter = Formatter()
+
+# literal text, placeholder name, format spec, conversion. The name is None for a literal only segment.
+Segment = Tuple[str, Optional[str], str, Optional[str]]
+
+
+class Template:
+    def __init__(self, localized: str):
+        self._localized = localized
+        self._segments: List[Segment] = []
+        self._is_static = True
+        # Placeholders we don't handle here, like attribute access or nested format specs, use format_map directly
+        self._use_format_map = False
+
+        try:
+            for literal, name, spec, conversion in _formatter.parse(localized):
+                if name is not None:
+                    self._is_static = False
+                    if not name or not name.isidentifier() or '{' in (spec or ''):
+                        self._use_format_map = True
+                self._segments.append((literal, name, spec or '', conversion))
+        except ValueError:
+            # Malformed format string, format_map raises the same error when formatting
+            self._use_format_map = True
+            self._is_static = False
+
+        if self._is_static:
+            self._static = ''.join(literal for literal, _, _, _ in self._segments)
+
+    def format(self, kvpairs: dict) -> str:
+        if self._is_static:
+            return self._static
+        if self._use_format_map:
+            return self._localized.format_map(SafeDict(kvpairs))
+
+        parts = []
+        for literal, name, spec, conversion in self._segments:
+            parts.append(literal)
+            if name is None:
+                continue
+            try:
+                value = kvpairs[name]
+            except KeyError:
+                value = '{' + name + '}'
+            if conversion is not None:
+                value = _formatter.convert_field(value, conversion)
+            parts.append(format(value, spec))
+        return ''.join(parts)
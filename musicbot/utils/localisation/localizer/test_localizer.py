@@ -0,0 +1,109 @@
+import discord
+
+from .dict_utils import SafeDict
+from .localizer import Localizer
+from .resolver import LocalizationResolver
+from .template import Template
+
+
+def legacy_format_str(localizer, s, lang, prefix=None, **kvpairs):
+    """How format_str worked before templates were compiled."""
+    ns = Localizer._parse_localization_string(s, localizer.localization_table[lang], prefix)
+    ns = Localizer._parse_localization_string(ns, localizer.all_localizations, prefix)
+    return ns.format_map(SafeDict(kvpairs))
+
+
+class TestTemplate():
+    def test_static(self):
+        assert Template("no placeholders {{here}}").format({}) == "no placeholders {here}"
+
+    def test_placeholders(self):
+        template = Template("{_a} and {_b:>4} and {_c!r}")
+        assert template.format({"_a": 1, "_b": "x", "_c": "y"}) == "1 and    x and 'y'"
+
+    def test_missing_placeholders_are_kept(self):
+        assert Template("{_a} {_b}").format({"_a": 1}) == "1 {_b}"
+
+    def test_same_as_format_map(self):
+        strings = ["`{_index:<6}`", "{_x.real}", "{_a}{_b}{_a}", "plain", ""]
+        kvpairs = {"_index": 3, "_x": 2, "_a": "a", "_b": "b"}
+        for s in strings:
+            assert Template(s).format(kvpairs) == s.format_map(SafeDict(kvpairs))
+
+
+class TestResolver():
+    def test_nested_references(self):
+        table = {f"k{i}": f"{{k{i + 1}}}" for i in range(20)}
+        table["k20"] = "end {_placeholder}"
+        resolver = LocalizationResolver({"en_en": table})
+        resolved = resolver.resolve("en_en")
+        assert all(value == "end {_placeholder}" for value in resolved.values())
+        assert not resolver.unresolved and not resolver.cycles
+
+    def test_dotted_and_cross_language_references(self):
+        tables = {
+            "en_en": {"music/now": "Now", "misc/text": "{music.now} {global.vars.repo}", "misc/other": "{nb_no.a}"},
+            "nb_no": {"a": "{b}", "b": "Nå"},
+            "global": {"vars/repo": "url"},
+        }
+        resolver = LocalizationResolver(tables)
+        assert resolver.resolve("en_en") == {"music/now": "Now", "misc/text": "Now url", "misc/other": "Nå"}
+
+    def test_unresolved(self):
+        resolver = LocalizationResolver({"en_en": {"a": "{missing.key} {_kept}", "b": 3, "c": "{b}"}})
+        assert resolver.resolve("en_en") == {"a": "{missing/key} {_kept}", "b": 3, "c": "3"}
+        assert resolver.unresolved == [("en_en", "a", "missing/key")]
+
+    def test_cycle(self):
+        resolver = LocalizationResolver({"en_en": {"a": "x{b}", "b": "y{c}", "c": "z{a}", "d": "{a}"}})
+        resolved = resolver.resolve("en_en")
+        assert resolver.cycles == [[("en_en", "a"), ("en_en", "b"), ("en_en", "c"), ("en_en", "a")]]
+        assert resolved["c"] == "z{a}"
+        assert resolved["a"] == resolved["d"] == "xyz{a}"
+
+
+class TestLocalizer():
+    localizer = Localizer("localization", "en_en")
+
+    def test_format_str_matches_legacy(self):
+        cases = [
+            ("{queue.globaltrack}", "music", {"_index": 1, "_title": "t", "_uri": "u", "_user_id": 2}),
+            ("{enqueue.toolong}", "music", {"_length": "10:00", "_max": "05:00"}),
+            ("{now}", "music", {}),
+            ("{pageindicator}", "help", {"_current": 1, "_total": 3, "_prefix": "!"}),
+            ("{errors.error_occurred}", None, {}),
+            ("{en_en.music.now} {nb_no.music.now}", None, {}),
+            ("no keys {_here}", "music", {"_here": "x"}),
+        ]
+        for lang in self.localizer.localization_table:
+            for s, prefix, kvpairs in cases:
+                expected = legacy_format_str(self.localizer, s, lang, prefix, **kvpairs)
+                assert self.localizer.format_str(s, lang, prefix, **kvpairs) == expected
+                # Again, now from the cache
+                assert self.localizer.format_str(s, lang, prefix, **kvpairs) == expected
+
+    def test_unknown_lang_uses_default(self):
+        assert self.localizer.format_str("{now}", "xx_xx", "music") == \
+            self.localizer.format_str("{now}", "en_en", "music")
+
+    def test_format_embed(self):
+        embed = discord.Embed(title="{now}", description="{_volume}", color=0x123456)
+        embed.set_footer(text="{requested_by} someone", icon_url="https://example.com/{now}.png")
+        embed.set_author(name="{now}")
+        embed.add_field(name="{enqueue.position}", value="`1(2)`")
+        original = embed.to_dict()
+
+        localized = self.localizer.format_embed(embed, "en_en", "music", _volume=10)
+        expected = self.localizer.format_dict(original, "en_en", "music", _volume=10)
+        # Only the text is localized
+        expected["footer"]["icon_url"] = original["footer"]["icon_url"]
+
+        assert localized.to_dict() == expected
+        assert embed.to_dict() == original
+
+    def test_format_embed_does_not_share_fields(self):
+        embed = discord.Embed(title="{now}")
+        localized = self.localizer.format_embed(embed, "en_en", "music")
+        localized.add_field(name="a", value="b")
+        assert not embed.fields
+        assert self.localizer.format_embed(embed, "en_en", "music").title == localized.title
@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+
+from discord.ext import commands
+from discord.ext.commands.view import StringView
+
+from .alias import Aliaser
+
+
+@commands.group(name='loop')
+async def loop(ctx):
+    pass
+
+
+@loop.command(name='start')
+async def loop_start(ctx):
+    pass
+
+
+@commands.command(name='play')
+async def play(ctx):
+    pass
+
+
+bot = SimpleNamespace(all_commands={'loop': loop, 'play': play})
+
+
+def make_ctx(content, locale='nb_no', prefix='!'):
+    view = StringView(content)
+    view.skip_string(prefix)
+    view.get_word()
+    return SimpleNamespace(view=view, prefix=prefix, locale=locale, bot=bot, command=None)
+
+
+class TestAliaser():
+    aliaser = Aliaser("localization", "en_en")
+
+    def test_convert_alias(self):
+        assert self.aliaser.convert_alias('en_en', 'p') == 'play'
+        assert self.aliaser.convert_alias('en_en', 'on', ['loop']) == 'start'
+        assert self.aliaser.convert_alias('en_en', 'unknown', ['loop']) == 'unknown'
+        assert self.aliaser.convert_alias('en_en', 'on', ['unknown']) == 'on'
+        # Unknown locales use the default language
+        assert self.aliaser.convert_alias('xx_xx', 'p') == 'play'
+
+    def test_get_command(self):
+        ctx = self.aliaser.get_command(make_ctx('!gjenta på  and  på'))
+        assert ctx.command is loop
+        assert ctx.invoked_with == 'loop'
+        # Only the subcommand alias is replaced, arguments are left alone
+        assert ctx.view.buffer == '!gjenta start  and  på'
+        assert ctx.view.end == len(ctx.view.buffer)
+        assert ctx.view.buffer[ctx.view.index:] == ' start  and  på'
+
+    def test_command_without_subcommands(self):
+        ctx = self.aliaser.get_command(make_ctx('!play på'))
+        assert ctx.command is play
+        assert ctx.view.buffer == '!play på'
+
+    def test_no_prefix(self):
+        ctx = make_ctx('gjenta på', prefix='')
+        ctx.prefix = None
+        assert self.aliaser.get_command(ctx).command is None
+
+    def test_get_subcommand(self):
+        ctx = make_ctx('!help gjenta på')
+        ctx.view.skip_ws()
+        self.aliaser.get_subcommand(ctx, group=None, parents=[])
+        assert ctx.view.buffer[ctx.view.index:ctx.view.end] == 'loop start'
@@ -0,0 +1,49 @@
+import os
+
+from .filecache import ParsedFileCache
+
+
+def write(path, content, mtime_ns=None):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestParsedFileCache():
+    def test_parse(self, tmp_path):
+        write(tmp_path / "a.yaml", "a:\n  b: c\n")
+        write(tmp_path / "a.txt", "text {_x}")
+
+        cache = ParsedFileCache()
+        assert cache.load_yaml(tmp_path / "a.yaml") == {"a": {"b": "c"}}
+        assert cache.load_text(tmp_path / "a.txt") == "text {_x}"
+
+    def test_persisted_between_runs(self, tmp_path):
+        write(tmp_path / "a.yaml", "a: 1\n", mtime_ns=10**18)
+        cache = ParsedFileCache(str(tmp_path / "cache"))
+        cache.load_yaml(tmp_path / "a.yaml")
+        cache.save()
+
+        # Same modification time and size, so the cached content is used
+        write(tmp_path / "a.yaml", "a: 2\n", mtime_ns=10**18)
+        cache = ParsedFileCache(str(tmp_path / "cache"))
+        assert cache.load_yaml(tmp_path / "a.yaml") == {"a": 1}
+
+    def test_changed_file_is_parsed(self, tmp_path):
+        write(tmp_path / "a.yaml", "a: 1\n", mtime_ns=10**18)
+        cache = ParsedFileCache(str(tmp_path / "cache"))
+        cache.load_yaml(tmp_path / "a.yaml")
+        cache.save()
+
+        write(tmp_path / "a.yaml", "a: 2\n", mtime_ns=2 * 10**18)
+        cache = ParsedFileCache(str(tmp_path / "cache"))
+        assert cache.load_yaml(tmp_path / "a.yaml") == {"a": 2}
+
+    def test_broken_cache_is_ignored(self, tmp_path):
+        write(tmp_path / "cache", "not a pickle")
+        write(tmp_path / "a.yaml", "a: 1\n")
+        cache = ParsedFileCache(str(tmp_path / "cache"))
+        assert cache.load_yaml(tmp_path / "a.yaml") == {"a": 1}
+        cache.save()
+        assert ParsedFileCache(str(tmp_path / "cache")).load_yaml(tmp_path / "a.yaml") == {"a": 1}
@@ -0,0 +1,61 @@
+import asyncio
+import os
+
+from .alias import Aliaser
+from .localizer import Localizer
+
+
+def write(path, content, mtime_ns=None):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def make_localizations(folder):
+    write(os.path.join(folder, "global", "vars.yaml"), "name: bot\n", mtime_ns=10**18)
+    write(os.path.join(folder, "en_en", "music.yaml"), "playing: '{global.vars.name} is playing'\n", mtime_ns=10**18)
+    write(os.path.join(folder, "en_en", "commands.yaml"), "play:\n  - p\n", mtime_ns=10**18)
+    write(os.path.join(folder, "no_nb", "music.yaml"), "playing: spiller\n", mtime_ns=10**18)
+    write(os.path.join(folder, "no_nb", "commands.yaml"), "play:\n  - spill\n", mtime_ns=10**18)
+
+
+class TestLocalizationLoader():
+    def test_nothing_changed(self, tmp_path):
+        make_localizations(tmp_path)
+        assert Localizer(tmp_path, "en_en").changed_localizations() == set()
+        assert Aliaser(tmp_path, "en_en").changed_localizations() == set()
+
+    def test_changed_languages(self, tmp_path):
+        make_localizations(tmp_path)
+        localizer = Localizer(tmp_path, "en_en")
+
+        write(tmp_path / "no_nb" / "music.yaml", "playing: spiller nå\n", mtime_ns=2 * 10**18)
+        write(tmp_path / "sv_se" / "music.yaml", "playing: spelar\n")
+        assert localizer.changed_localizations() == {"no_nb", "sv_se"}
+
+    def test_reload_changed(self, tmp_path):
+        make_localizations(tmp_path)
+        localizer = Localizer(tmp_path, "en_en")
+        old_table = localizer.localization_table
+        assert localizer.format_str("{music.playing}", "en_en") == "bot is playing"
+
+        write(tmp_path / "global" / "vars.yaml", "name: musicbot\n", mtime_ns=2 * 10**18)
+        assert asyncio.run(localizer.reload()) == {"global"}
+
+        # Languages referencing a changed language are resolved again, the old table is left untouched
+        assert localizer.format_str("{music.playing}", "en_en") == "musicbot is playing"
+        assert old_table["en_en"]["music/playing"] == "bot is playing"
+        assert asyncio.run(localizer.reload()) == set()
+
+    def test_removed_language(self, tmp_path):
+        make_localizations(tmp_path)
+        aliaser = Aliaser(tmp_path, "en_en")
+
+        os.remove(tmp_path / "no_nb" / "music.yaml")
+        os.remove(tmp_path / "no_nb" / "commands.yaml")
+        os.rmdir(tmp_path / "no_nb")
+        assert asyncio.run(aliaser.reload()) == {"no_nb"}
+        assert set(aliaser.localization_table) == {"en_en"}
+        assert aliaser.convert_alias("en_en", "p") == "play"
@@ -0,0 +1,4 @@
+from .cache import LyricsCache
+from .extraction import extract_lyrics, parse_lyrics
+
+__all__ = ['LyricsCache', 'extract_lyrics', 'parse_lyrics']
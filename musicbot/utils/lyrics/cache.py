@@ -0,0 +1,102 @@
+import json
+import logging
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+"""
+Cache for lyrics lookups. Genius search hits are cached by normalized query and the lyrics text by Genius song id, so
+the lyrics of a popular song are only searched for and scraped once while they are cached.
+"""
+
+SEARCH_TTL = 7 * 24 * 60 * 60
+LYRICS_TTL = 30 * 24 * 60 * 60
+
+Key = Tuple[str, str]  # (kind, key)
+
+
+def normalize_query(query: str) -> str:
+    return ' '.join(query.casefold().split())
+
+
+class LyricsCache:
+    """Keeps the most recently used entries in memory, backed by an SQLite database. Entries expire after their TTL."""
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 256,
+                 search_ttl: float = SEARCH_TTL, lyrics_ttl: float = LYRICS_TTL):
+        """path: the database file, the cache is kept in memory only if None."""
+        self.logger = logging.getLogger("musicbot").getChild("LyricsCache")
+        self._entries: OrderedDict[Key, Tuple[float, Any]] = OrderedDict()
+        self._max_entries = max_entries
+        self.search_ttl = search_ttl
+        self.lyrics_ttl = lyrics_ttl
+
+        self._connection: Optional[sqlite3.Connection] = None
+        if path:
+            os.makedirs(os.path.dirname(os.path.realpath(path)), exist_ok=True)
+            self._connection = sqlite3.connect(path)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS lyrics_cache (kind TEXT NOT NULL, key TEXT NOT NULL, "
+                                     "data TEXT NOT NULL, expires REAL NOT NULL, PRIMARY KEY (kind, key))")
+            with self._connection:
+                self._connection.execute("DELETE FROM lyrics_cache WHERE expires < ?", (time.time(),))
+
+    def _remember(self, key: Key, expires: float, value):
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _get(self, key: Key) -> Optional[Any]:
+        now = time.time()
+        if (entry := self._entries.get(key)) is not None:
+            expires, value = entry
+            if expires >= now:
+                self._entries.move_to_end(key)
+                return value
+            del self._entries[key]
+
+        if self._connection is None:
+            return None
+        row = self._connection.execute("SELECT data, expires FROM lyrics_cache WHERE kind = ? AND key = ?",
+                                       key).fetchone()
+        if row is None or row[1] < now:
+            return None
+        value = json.loads(row[0])
+        self._remember(key, row[1], value)
+        return value
+
+    def _set(self, key: Key, value, ttl: float):
+        expires = time.time() + ttl
+        self._remember(key, expires, value)
+        if self._connection is None:
+            return
+        try:
+            with self._connection:
+                self._connection.execute("INSERT INTO lyrics_cache (kind, key, data, expires) VALUES (?, ?, ?, ?) "
+                                         "ON CONFLICT(kind, key) DO UPDATE SET data = excluded.data, "
+                                         "expires = excluded.expires", (*key, json.dumps(value), expires))
+        except sqlite3.Error:
+            self.logger.exception("Could not store %s %s in the lyrics cache" % key)
+
+    def get_song(self, query: str) -> Optional[dict]:
+        """The Genius song found for a search query."""
+        return self._get(('song', normalize_query(query)))
+
+    def set_song(self, query: str, song: dict):
+        self._set(('song', normalize_query(query)), song, self.search_ttl)
+
+    def get_lyrics(self, song_id) -> Optional[str]:
+        """The lyrics text of a Genius song."""
+        return self._get(('lyrics', str(song_id)))
+
+    def set_lyrics(self, song_id, lyrics: str):
+        self._set(('lyrics', str(song_id)), lyrics, self.lyrics_ttl)
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
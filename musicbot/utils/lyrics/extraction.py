@@ -0,0 +1,41 @@
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+
+"""
+Extraction of the lyrics text from a Genius song page. Only the lyrics containers of the page are parsed, and the
+parsing is done in a worker thread so large pages don't hold up the event loop.
+"""
+
+# The lyrics are split over several containers, e.g. around ads
+_lyrics_containers = SoupStrainer('div', attrs={'data-lyrics-container': True})
+_blank_lines = re.compile(r'\n{3,}')
+_source_newline = re.compile(r'\s*\n\s*')
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="lyrics")
+
+
+def parse_lyrics(html: str) -> str:
+    """Returns the lyrics of a Genius song page as plain text, an empty string if the page has none."""
+    soup = BeautifulSoup(html, 'html.parser', parse_only=_lyrics_containers)
+
+    # Headers and the like inside the containers are not part of the lyrics
+    for excluded in soup.find_all(attrs={'data-exclude-from-selection': 'true'}):
+        excluded.decompose()
+    # Line breaks in the page source are just whitespace, only <br> tags break lines
+    for string in soup.find_all(string=_source_newline):
+        string.replace_with(NavigableString(_source_newline.sub(' ', string)))
+    for br in soup.find_all('br'):
+        br.replace_with(NavigableString('\n'))
+
+    containers = soup.find_all('div', attrs={'data-lyrics-container': True})
+    text = '\n'.join(container.get_text() for container in containers)
+    text = '\n'.join(line.strip() for line in text.split('\n'))
+    return _blank_lines.sub('\n\n', text).strip()
+
+
+async def extract_lyrics(html: str) -> str:
+    """parse_lyrics, run in a worker thread."""
+    return await asyncio.get_running_loop().run_in_executor(_executor, parse_lyrics, html)
@@ -0,0 +1,44 @@
+import time
+
+from .cache import LyricsCache
+
+
+class TestLyricsCache():
+    def test_memory_only(self):
+        cache = LyricsCache()
+        cache.set_song('Never  Gonna Give You Up', {'id': 1, 'url': 'https://genius.com/1'})
+        assert cache.get_song('never gonna give you up ') == {'id': 1, 'url': 'https://genius.com/1'}
+        assert cache.get_song('together forever') is None
+
+    def test_persisted(self, tmp_path):
+        cache = LyricsCache(str(tmp_path / "lyrics.sqlite"))
+        cache.set_song('query', {'id': 1})
+        cache.set_lyrics(1, 'line 1\nline 2')
+        cache.close()
+
+        cache = LyricsCache(str(tmp_path / "lyrics.sqlite"))
+        assert cache.get_song('query') == {'id': 1}
+        assert cache.get_lyrics(1) == 'line 1\nline 2'
+        assert cache.get_lyrics(2) is None
+
+    def test_expired(self, tmp_path):
+        cache = LyricsCache(str(tmp_path / "lyrics.sqlite"), lyrics_ttl=-1)
+        cache.set_lyrics(1, 'lyrics')
+        assert cache.get_lyrics(1) is None
+
+    def test_memory_is_bounded(self, tmp_path):
+        cache = LyricsCache(str(tmp_path / "lyrics.sqlite"), max_entries=2)
+        for song_id in range(3):
+            cache.set_lyrics(song_id, f'lyrics {song_id}')
+        assert len(cache._entries) == 2
+        # Evicted entries are still on disk
+        assert cache.get_lyrics(0) == 'lyrics 0'
+
+    def test_expired_rows_are_removed(self, tmp_path):
+        cache = LyricsCache(str(tmp_path / "lyrics.sqlite"), search_ttl=0.01)
+        cache.set_song('query', {'id': 1})
+        cache.close()
+        time.sleep(0.02)
+
+        cache = LyricsCache(str(tmp_path / "lyrics.sqlite"))
+        assert cache._connection.execute("SELECT COUNT(*) FROM lyrics_cache").fetchone()[0] == 0
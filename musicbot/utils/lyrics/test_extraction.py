@@ -0,0 +1,27 @@
+import asyncio
+
+from .extraction import extract_lyrics, parse_lyrics
+
+page = '''
+<html><body>
+<div class="header">Genius</div>
+<div data-lyrics-container="true">
+[Verse 1]<br/>We&#x27;re no strangers to <a href="#"><span>love</span></a><br>You know the rules
+<div data-exclude-from-selection="true">You might also like</div>
+</div>
+<div class="ad">Advertisement</div>
+<div data-lyrics-container="true">[Chorus]<br/>Never gonna give you up<br/><br/><br/><br/>Never gonna let you down</div>
+</body></html>
+'''
+
+
+class TestLyricsExtraction():
+    def test_all_containers(self):
+        assert parse_lyrics(page) == ("[Verse 1]\nWe're no strangers to love\nYou know the rules\n"
+                                      "[Chorus]\nNever gonna give you up\n\nNever gonna let you down")
+
+    def test_no_lyrics(self):
+        assert parse_lyrics('<html><body><div>Not found</div></body></html>') == ''
+
+    def test_extract_in_thread(self):
+        assert asyncio.run(extract_lyrics(page)) == parse_lyrics(page)
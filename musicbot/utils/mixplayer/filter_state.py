@@ -0,0 +1,33 @@
+from typing import Any, Dict, Mapping
+
+from lavalink.filters import Filter
+
+
+def serialize_filters(filters: Mapping[str, Filter]) -> Dict[str, Any]:
+    serialized: Dict[str, Any] = {}
+    for _filter in filters.values():
+        serialized.update(_filter.serialize())
+    return serialized
+
+
+class FilterState:
+    """
+    The volume and filters last sent to Lavalink. The desired state of a player is compared against it,
+    so only what changed is sent, in a single update, and nothing at all when the state is the same.
+    """
+    def __init__(self, volume: int = 100):
+        self._volume = volume
+        self._filters: Dict[str, Any] = {}
+
+    def changes(self, volume: int, filters: Mapping[str, Filter]) -> Dict[str, Any]:
+        """The arguments of the player update that applies the desired state, empty if already applied."""
+        changes: Dict[str, Any] = {}
+        if volume != self._volume:
+            changes['volume'] = volume
+        if serialize_filters(filters) != self._filters:
+            changes['filters'] = list(filters.values())
+        return changes
+
+    def applied(self, volume: int, filters: Mapping[str, Filter]):
+        self._volume = volume
+        self._filters = serialize_filters(filters)
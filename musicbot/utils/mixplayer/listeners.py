@@ -0,0 +1,61 @@
+from typing import AbstractSet, Dict, Iterable, Optional, Set, Tuple
+
+import discord
+
+_EMPTY: AbstractSet = frozenset()
+
+
+def is_listening(member: discord.Member, voice_state: Optional[discord.VoiceState]) -> bool:
+    return not (member.bot or voice_state is None or voice_state.channel is None or
+                voice_state.deaf or voice_state.self_deaf)
+
+
+class ListenerTracker:
+    """
+    The humans listening in each voice channel of a guild, i.e. members in the channel that are not deafened.
+    A channel is scanned when it is synced, after that voice state updates are applied as deltas.
+    """
+    def __init__(self):
+        self._channels: Dict[int, Set[discord.Member]] = {}
+        self._member_channels: Dict[int, int] = {}
+
+    def sync(self, channel_id: int, members: Iterable[discord.Member]):
+        """Replaces the listeners of a channel with those found by scanning its members."""
+        for member in list(self._channels.get(channel_id, _EMPTY)):
+            self._move(member, None)
+        for member in members:
+            if is_listening(member, member.voice):
+                self._move(member, channel_id)
+
+    def update(self, member: discord.Member,
+               voice_state: Optional[discord.VoiceState]) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Applies the new voice state of a member.
+        Returns the channel the member stopped and started listening in, both are None if nothing changed.
+        """
+        channel_id = voice_state.channel.id if is_listening(member, voice_state) else None
+        previous = self._member_channels.get(member.id)
+        if channel_id == previous:
+            return None, None
+        self._move(member, channel_id)
+        return previous, channel_id
+
+    def _move(self, member: discord.Member, channel_id: Optional[int]):
+        if (previous := self._member_channels.pop(member.id, None)) is not None:
+            listeners = self._channels[previous]
+            listeners.discard(member)
+            if not listeners:
+                del self._channels[previous]
+        if channel_id is not None:
+            self._member_channels[member.id] = channel_id
+            self._channels.setdefault(channel_id, set()).add(member)
+
+    def listeners(self, channel_id: Optional[int]) -> AbstractSet[discord.Member]:
+        return self._channels.get(channel_id, _EMPTY)
+
+    def count(self, channel_id: Optional[int]) -> int:
+        return len(self._channels.get(channel_id, _EMPTY))
+
+    def clear(self):
+        self._channels.clear()
+        self._member_channels.clear()
@@ -1,13 +1,24 @@
 import logging
-from typing import Dict, List, Optional, Set, Tuple
+from typing import AbstractSet, Any, Awaitable, Callable, ClassVar, Dict, List, Optional, Set, Tuple, Type, Union
 
 import discord
 import lavalink
 from lavalink import AudioTrack, DefaultPlayer, Node
-from lavalink.events import QueueEndEvent, TrackEndEvent, TrackExceptionEvent, TrackStartEvent, TrackStuckEvent
-from lavalink.filters import Equalizer, Timescale
-
+from lavalink.events import (
+    Event,
+    QueueEndEvent,
+    TrackEndEvent,
+    TrackExceptionEvent,
+    TrackStartEvent,
+    TrackStuckEvent,
+)
+
+from .filter_state import FilterState
+from .listeners import ListenerTracker
 from .mixqueue import MixQueue
+from .presets import BASS_BOOST, NIGHTCORE, NO_PRESET, FilterPreset, stack_filters
+from .track_length import TrackLengthPolicy
+from .votes import VoteRegistry
 
 RequesterType = discord.Member
 
@@ -18,26 +29,15 @@ class MixPlayer(DefaultPlayer):
 
         self.queue: MixQueue[AudioTrack] = MixQueue()
 
-        self.listeners: Set[RequesterType] = set()
-        self.voteables: Dict[int, Set[RequesterType]] = {}
+        self.listener_tracker = ListenerTracker()
+        self.votes = VoteRegistry()
+        self.track_length_policy: Optional[TrackLengthPolicy] = None
         self.skip_voters: Set[int] = set()
+        self.filter_state = FilterState(self.volume)
+        self.preset: FilterPreset = NO_PRESET
         self.boosted: bool = False
         self.nightcore_enabled: bool = False
         self.logger = logging.getLogger("musicbot").getChild("MixPlayer")
-        bands = [
-            (0, 0.15),
-            (1, 0.15),
-            (2, 0.25),
-            (3, 0.15),
-            (4, -0.15),
-            (5, -0.1),
-            (6, -0.05)
-        ]
-        self.bass_boost_filter: lavalink.Filter = Equalizer()
-        self.bass_boost_filter.update(bands=bands)
-
-        self.nightcore_filter: lavalink.Filter = Timescale()
-        self.nightcore_filter.update(speed=1.25, pitch=1.25)
 
     def add(self, requester: RequesterType, track: AudioTrack,
             pos: Optional[int] = None) -> Tuple[AudioTrack, int, int]:
@@ -120,8 +120,7 @@ class MixPlayer(DefaultPlayer):
         if not track:
             if self.queue.empty:
                 self.logger.debug("No track provided to play function and queue is empty. Resetting Audio filters")
-                await self.bassboost(False)
-                await self.nightcoreify(False)
+                await self.update_audio(bassboost=False, nightcore=False, preset=NO_PRESET)
                 await self.stop()
                 await self.client._dispatch_event(QueueEndEvent(self))
                 return
@@ -156,46 +155,59 @@ class MixPlayer(DefaultPlayer):
         self.logger.info("Music player stopped, clearing current track and stopping looping")
         self.clear_votes()
 
-    def update_listeners(self, member: RequesterType, voice_state):
-        if self.channel_id is not None:
-            vc = int(self.channel_id)
-            if voice_state.channel is None or voice_state.channel.id != vc:
-                self.logger.debug(f"User {member.display_name} left the voice channel")
-                self.listeners.discard(member)
-                self.remove_member_votes(member)
-            else:
-                if voice_state.deaf or voice_state.self_deaf:
-                    self.logger.debug(f"User {member.display_name} is now deafened")
-                    self.listeners.discard(member)
-                    self.remove_member_votes(member)
-                else:
-                    self.listeners.add(member)
-            self.logger.debug(f"Member voice state update. Votes are now {self.voteables}")
-
-    def clear_listeners(self):
-        self.logger.debug("Listeners cleared")
-        self.listeners.clear()
-
-    def add_vote(self, category, member: RequesterType):
-        if member in self.listeners:
-            if category not in self.voteables:
-                self.voteables[category] = set()
-            self.voteables[category].add(member)
-            self.logger.debug(f"{member.display_name} added vote for {category}")
+    @property
+    def listeners(self) -> AbstractSet[RequesterType]:
+        """The members listening in the voice channel of the player."""
+        return self.listener_tracker.listeners(self._channel())
+
+    @property
+    def listener_count(self) -> int:
+        return self.listener_tracker.count(self._channel())
+
+    def _channel(self) -> Optional[int]:
+        return int(self.channel_id) if self.channel_id is not None else None
+
+    def join_listeners(self, channel: discord.VoiceChannel):
+        """
+        Rescans the listeners whenever the bot joins, moves or reconnects, so updates missed in the meantime
+        do not leave the counts wrong.
+        """
+        self.listener_tracker.clear()
+        self.listener_tracker.sync(channel.id, channel.members)
+        self.logger.debug("Scanned listeners of %s", channel.name)
+        self.clear_votes()
+        self.votes.set_listener_count(self.listener_tracker.count(channel.id))
+
+    def update_listeners(self, member: RequesterType, voice_state) -> bool:
+        """Applies the voice state of a member, returns whether the listeners of the player changed."""
+        left, joined = self.listener_tracker.update(member, voice_state)
+        channel = self._channel()
+        if channel is None or channel not in (left, joined):
+            return False
+        if left == channel:
+            self.logger.debug("User %s stopped listening", member.display_name)
+            self.remove_member_votes(member)
+        self.votes.set_listener_count(self.listener_tracker.count(channel))
+        self.logger.debug("Member voice state update. Votes are now %s", self.votes)
+        return True
+
+    def add_vote(self, category: str, member: RequesterType) -> bool:
+        """Adds the vote of a listener, returns whether it is a new vote."""
+        if member in self.listeners and self.votes.add(category, member.id):
+            self.logger.debug("%s added vote for %s", member.display_name, category)
+            return True
+        return False
 
     def remove_member_votes(self, member: RequesterType):
-        for _, votes in self.voteables.items():
-            votes.discard(member)
-        self.logger.debug(f"Removing votes for {member.display_name}.")
+        self.votes.remove_member(member.id)
+        self.logger.debug("Removing votes for %s.", member.display_name)
 
-    def get_voters(self, category) -> Set[RequesterType]:
-        if category not in self.voteables:
-            self.voteables[category] = set()
-        return self.voteables[category]
+    def get_voters(self, category: str) -> AbstractSet[int]:
+        """The ids of the members that voted for category."""
+        return self.votes.voters(category)
 
     def clear_votes(self):
-        for _, votes in self.voteables.items():
-            votes.clear()
+        self.votes.clear()
 
     def enable_looping(self, looping: bool):
         if (not self.queue.looping) and looping:
@@ -206,41 +218,90 @@ class MixPlayer(DefaultPlayer):
         elif not looping and self.queue.looping:
             self.queue.enable_looping(looping)
 
-    async def handle_event(self, event):
+    async def handle_event(self, event: Event):
         """Handles the given event as necessary."""
-        if isinstance(event, (TrackStuckEvent, TrackExceptionEvent)) or \
-                (isinstance(event, TrackEndEvent) and event.reason.may_start_next()):
-            if isinstance(event, (TrackStuckEvent, TrackExceptionEvent)):
-                self.logger.debug("Event stuck or except: %s" % event)
-            if isinstance(event, TrackEndEvent) and event.reason.may_start_next():
-                self.logger.debug("Event end: %s, %s, %s" % (event, event.reason, event.reason.may_start_next()))
-                if event.track is not None:
-                    self.logger.debug("Event end track: %s, pos: %s" % (event.track, event.track.position))
-            self.logger.debug("Track ended, clearing votes")
-            self.skip_voters.clear()
-            for _, votes in self.voteables.items():
-                votes.clear()
-            await self.play()
+        if (handler := self._event_handlers.get(type(event))) is not None:
+            await handler(self, event)
+
+    async def _on_track_failed(self, event: Union[TrackStuckEvent, TrackExceptionEvent]):
+        self.logger.debug("Event stuck or except: %s", event)
+        await self._track_ended()
+
+    async def _on_track_end(self, event: TrackEndEvent):
+        if not event.reason.may_start_next():
+            return
+        self.logger.debug("Event end: %s, %s", event, event.reason)
+        if event.track is not None:
+            self.logger.debug("Event end track: %s, pos: %s", event.track, event.track.position)
+        await self._track_ended()
+
+    async def _track_ended(self):
+        self.logger.debug("Track ended, clearing votes")
+        self.skip_voters.clear()
+        self.clear_votes()
+        await self.play()
+
+    # Handlers by the exact type of the event, other events are ignored
+    _event_handlers: ClassVar[Dict[Type[Event], Callable[['MixPlayer', Any], Awaitable]]] = {
+        TrackEndEvent: _on_track_end,
+        TrackStuckEvent: _on_track_failed,
+        TrackExceptionEvent: _on_track_failed,
+    }
+
+    async def update_audio(self, volume: Optional[int] = None, bassboost: Optional[bool] = None,
+                           nightcore: Optional[bool] = None, preset: Optional[FilterPreset] = None):
+        """
+        Changes the volume and filters together, Lavalink gets a single update, if anything changed at all.
+        Bass boost and nightcore are stacked on the preset: equalizer gains add up and timescales multiply.
+        NO_PRESET turns the preset off.
+        """
+        if volume is not None:
+            self.volume = max(min(volume, 1000), 0)
+        if bassboost is not None:
+            if self.boosted != bassboost:
+                self.logger.info(f"{'Enabling' if bassboost else 'Disabling'} bass boost")
+            self.boosted = bassboost
+        if nightcore is not None:
+            if self.nightcore_enabled != nightcore:
+                self.logger.info(f"{'Enabling' if nightcore else 'Disabling'} nightcore mode")
+            self.nightcore_enabled = nightcore
+        if preset is not None:
+            if self.preset is not preset:
+                self.logger.info("Filter preset set to %s", preset.name)
+            self.preset = preset
+
+        filters = dict(self.preset.filters)
+        if self.boosted:
+            stack_filters(filters, BASS_BOOST.filters)
+        if self.nightcore_enabled:
+            stack_filters(filters, NIGHTCORE.filters)
+        self.filters = filters
+        await self._apply_audio()
+
+    async def _apply_audio(self):
+        if changes := self.filter_state.changes(self.volume, self.filters):
+            await self.node.update_player(guild_id=self._internal_id, **changes)
+            self.filter_state.applied(self.volume, self.filters)
+
+    async def _apply_filters(self):
+        # Filters changed through the methods of DefaultPlayer are diffed as well
+        await self._apply_audio()
+
+    async def change_node(self, node: Node):
+        # A new node starts out without filters and at full volume. DefaultPlayer only sends the volume when a track
+        # is playing and the filters when there are any, the state is applied afterwards so the node surely has it.
+        self.filter_state = FilterState()
+        await super().change_node(node)
+        await self._apply_audio()
+
+    async def set_volume(self, vol: int):
+        await self.update_audio(volume=vol)
 
     async def bassboost(self, boost: bool):
-        changed = self.boosted != boost
-        self.boosted = boost
-        if changed:
-            self.logger.info(f"{'Enabling' if self.boosted else 'Disabling'} bass boost")
-        if boost:
-            await self.set_filter(self.bass_boost_filter)
-        else:
-            await self.remove_filter(self.bass_boost_filter)
+        await self.update_audio(bassboost=boost)
 
     async def nightcoreify(self, nightcore: bool):
-        changed = self.nightcore_enabled != nightcore
-        self.nightcore_enabled = nightcore
-        if changed:
-            self.logger.info(f"{'Enabling' if self.nightcore_enabled else 'Disabling'} nightcore mode")
-        if nightcore:
-            await self.set_filter(self.nightcore_filter)
-        else:
-            await self.remove_filter(self.nightcore_filter)
+        await self.update_audio(nightcore=nightcore)
 
     @property
     def looping(self):
@@ -0,0 +1,159 @@
+import logging
+import re
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
+
+from lavalink.filters import (
+    ChannelMix,
+    Distortion,
+    Equalizer,
+    Filter,
+    Karaoke,
+    LowPass,
+    Rotation,
+    Timescale,
+    Tremolo,
+    Vibrato,
+)
+
+import yaml
+
+"""
+Filter presets, named combinations of Lavalink filters.
+A preset is described by the keyword arguments of each filter's update method, e.g.
+
+    nightcore:
+      timescale: {speed: 1.25, pitch: 1.25}
+
+The shared presets come from the config file and are built once, guild presets are stored in the settings.
+"""
+
+FILTER_TYPES = {_filter.__name__.lower(): _filter for _filter in
+                (ChannelMix, Distortion, Equalizer, Karaoke, LowPass, Rotation, Timescale, Tremolo, Vibrato)}
+PRESET_NAME = re.compile(r'^[a-z0-9_-]{1,32}$')
+RESERVED_NAMES = {'none', 'off'}  # Used to turn presets off
+# A fenced block with an optional language tag, or inline code, as descriptions are pasted in Discord
+CODE_BLOCK = re.compile(r'```(?:[\w+-]*\n)?(?P<block>.*?)```|`(?P<inline>[^`]*)`', re.DOTALL)
+
+BUILTIN_PRESETS: Dict[str, Mapping[str, Mapping[str, Any]]] = {
+    'bassboost': {'equalizer': {'bands': [(0, 0.15), (1, 0.15), (2, 0.25), (3, 0.15), (4, -0.15), (5, -0.1),
+                                          (6, -0.05)]}},
+    'nightcore': {'timescale': {'speed': 1.25, 'pitch': 1.25}},
+    'vaporwave': {'timescale': {'speed': 0.8, 'pitch': 0.8}},
+    'karaoke': {'karaoke': {}},
+}
+
+
+class FilterPreset(NamedTuple):
+    """The filters are shared by every player using the preset, they must not be modified."""
+    name: str
+    filters: Mapping[str, Filter]
+
+
+NO_PRESET = FilterPreset('none', MappingProxyType({}))
+
+
+def parse_description(text: str) -> Any:
+    """The description of a preset written as YAML, raises yaml.YAMLError if it can't be parsed."""
+    text = text.strip()
+    if match := CODE_BLOCK.fullmatch(text):
+        text = match['block'] if match['block'] is not None else match['inline']
+    return yaml.safe_load(text)
+
+
+def build_preset(name: str, description: Mapping[str, Any]) -> FilterPreset:
+    """Raises ValueError if the name or description is invalid."""
+    if not isinstance(name, str) or not PRESET_NAME.match(name) or name in RESERVED_NAMES:
+        raise ValueError(f'Invalid preset name {name!r}, use at most 32 lowercase letters, digits, - or _')
+    if not isinstance(description, Mapping) or not description:
+        raise ValueError(f'Preset {name} has no filters')
+
+    filters = {}
+    for filter_name, values in description.items():
+        if (filter_type := FILTER_TYPES.get(filter_name)) is None:
+            raise ValueError(f'Unknown filter {filter_name}, expected one of {", ".join(FILTER_TYPES)}')
+        if not isinstance(values, Mapping):
+            raise ValueError(f'The values of {filter_name} must be a mapping')
+        _filter = filter_type()
+        try:
+            if filter_name == 'equalizer':
+                values = dict(values, bands=[tuple(band) for band in values.get('bands', [])])
+            _filter.update(**values)
+        except (TypeError, ValueError, KeyError) as err:
+            raise ValueError(f'Invalid values for {filter_name}: {err}') from err
+        filters[filter_name] = _filter
+    return FilterPreset(name, MappingProxyType(filters))
+
+
+def _stack_equalizers(lower: Equalizer, upper: Equalizer) -> Equalizer:
+    equalizer = Equalizer()
+    equalizer.values = [max(-0.25, min(1.0, gain + added)) for gain, added in zip(lower.values, upper.values,
+                                                                                  strict=True)]
+    return equalizer
+
+
+def _stack_timescales(lower: Timescale, upper: Timescale) -> Timescale:
+    timescale = Timescale()
+    timescale.values = {key: value * upper.values[key] for key, value in lower.values.items()}
+    return timescale
+
+
+STACKABLE_FILTERS = {'equalizer': _stack_equalizers, 'timescale': _stack_timescales}
+
+
+def stack_filters(filters: Dict[str, Filter], upper: Mapping[str, Filter]):
+    """
+    Applies the filters of upper on top of filters. The gains of equalizers are added and the factors of timescales
+    multiplied, other filters of upper replace those of the same kind.
+    New filters are created, the filters of presets are never modified.
+    """
+    for name, _filter in upper.items():
+        if (lower := filters.get(name)) is not None and (stack := STACKABLE_FILTERS.get(name)) is not None:
+            filters[name] = stack(lower, _filter)
+        else:
+            filters[name] = _filter
+
+
+# Built once, shared by every player
+BUILTIN: Mapping[str, FilterPreset] = MappingProxyType(
+    {name: build_preset(name, description) for name, description in BUILTIN_PRESETS.items()})
+BASS_BOOST = BUILTIN['bassboost']
+NIGHTCORE = BUILTIN['nightcore']
+
+
+class FilterPresets:
+    """
+    The shared presets, the built in presets and those from the config file, and the presets of each guild.
+    Guild presets take precedence and are rebuilt only when the settings of the guild change.
+    """
+    def __init__(self, settings, presets: Optional[Mapping[str, Mapping[str, Any]]] = None):
+        self.settings = settings
+        self.logger = logging.getLogger("musicbot").getChild("FilterPresets")
+        self.shared: Mapping[str, FilterPreset] = MappingProxyType({**BUILTIN, **self._build_all(presets or {})})
+        self._guild_presets: Dict[str, Tuple[int, Mapping[str, FilterPreset]]] = {}
+
+    def _build_all(self, descriptions: Mapping[str, Any]) -> Dict[str, FilterPreset]:
+        presets = {}
+        for name, description in descriptions.items():
+            try:
+                presets[name] = build_preset(name, description)
+            except ValueError as err:
+                self.logger.error("Skipping filter preset: %s", err)
+        return presets
+
+    def guild_presets(self, guild) -> Mapping[str, FilterPreset]:
+        key = str(guild.id)
+        version = self.settings.version(guild)
+        cached = self._guild_presets.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        presets = MappingProxyType(self._build_all(self.settings.get(guild, 'filter_presets', {}) or {}))
+        self._guild_presets[key] = (version, presets)
+        return presets
+
+    def get(self, guild, name: str) -> Optional[FilterPreset]:
+        name = name.lower()
+        return self.guild_presets(guild).get(name) or self.shared.get(name)
+
+    def names(self, guild) -> Tuple[str, ...]:
+        return tuple(sorted({*self.shared, *self.guild_presets(guild)}))
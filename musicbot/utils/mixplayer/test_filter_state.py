@@ -0,0 +1,34 @@
+from lavalink.filters import Equalizer, Timescale
+
+from .filter_state import FilterState
+
+
+def nightcore():
+    timescale = Timescale()
+    timescale.update(speed=1.25, pitch=1.25)
+    return timescale
+
+
+class TestFilterState():
+    def test_nothing_changed(self):
+        state = FilterState()
+        assert state.changes(100, {}) == {}
+
+    def test_changes_are_combined(self):
+        state = FilterState()
+        filters = {'timescale': nightcore()}
+        changes = state.changes(50, filters)
+        assert changes == {'volume': 50, 'filters': list(filters.values())}
+
+        state.applied(50, filters)
+        assert state.changes(50, filters) == {}
+        assert state.changes(50, {'timescale': nightcore()}) == {}  # Same values, other instance
+        assert state.changes(80, filters) == {'volume': 80}
+
+    def test_filters_changed_in_place(self):
+        state = FilterState()
+        equalizer = Equalizer()
+        state.applied(100, {'equalizer': equalizer})
+        equalizer.update(bands=[(0, 0.25)])
+        assert state.changes(100, {'equalizer': equalizer}) == {'filters': [equalizer]}
+        assert state.changes(100, {}) == {'filters': []}
@@ -0,0 +1,52 @@
+from types import SimpleNamespace
+
+from .listeners import ListenerTracker
+
+
+class Member():
+    def __init__(self, member_id, channel_id=None, bot=False, deaf=False):
+        self.id = member_id
+        self.bot = bot
+        self.voice = state(channel_id, deaf)
+
+    def __eq__(self, other):
+        return self.id == other.id
+
+    def __hash__(self):
+        return self.id
+
+
+def state(channel_id, deaf=False):
+    channel = SimpleNamespace(id=channel_id) if channel_id is not None else None
+    return SimpleNamespace(channel=channel, deaf=False, self_deaf=deaf)
+
+
+class TestListenerTracker():
+    def test_sync(self):
+        tracker = ListenerTracker()
+        members = [Member(1, 10), Member(2, 10, bot=True), Member(3, 10, deaf=True), Member(4, 10)]
+        tracker.sync(10, members)
+        assert tracker.count(10) == 2
+
+        # A rescan corrects missed updates
+        members[0].voice = state(None)
+        tracker.sync(10, members)
+        assert tracker.listeners(10) == {members[3]}
+        assert tracker.update(members[0], state(None)) == (None, None)
+
+    def test_deltas(self):
+        tracker = ListenerTracker()
+        alice, bob = Member(1, 10), Member(2, 10)
+        tracker.sync(10, [alice, bob])
+
+        assert tracker.update(alice, state(20)) == (10, 20)
+        assert tracker.listeners(10) == {bob}
+        assert tracker.listeners(20) == {alice}
+        assert tracker.update(alice, state(20)) == (None, None)
+
+        assert tracker.update(bob, state(10, deaf=True)) == (10, None)
+        assert tracker.count(10) == 0
+        assert tracker.update(bob, state(10)) == (None, 10)
+        assert tracker.update(bob, state(None)) == (10, None)
+        assert tracker.count(10) == 0
+        assert tracker.count(None) == 0
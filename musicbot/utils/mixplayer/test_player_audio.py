@@ -0,0 +1,51 @@
+import asyncio
+import logging
+
+from lavalink import DefaultPlayer
+
+from .filter_state import FilterState
+from .player import MixPlayer
+from .presets import NO_PRESET
+
+
+class Node():
+    def __init__(self):
+        self.updates = []
+
+    async def update_player(self, guild_id, **changes):
+        self.updates.append(changes)
+
+
+def make_player(node):
+    # Only the parts update_audio needs, no Lavalink client is involved
+    player = MixPlayer.__new__(MixPlayer)
+    player.logger = logging.getLogger("musicbot").getChild("MixPlayer")
+    player._internal_id = '1'
+    player.node = node
+    player.volume = 100
+    player.filters = {}
+    player.filter_state = FilterState()
+    player.preset = NO_PRESET
+    player.boosted = False
+    player.nightcore_enabled = False
+    return player
+
+
+class TestPlayerAudio():
+    def test_volume_restored_on_new_node(self, monkeypatch):
+        async def change_node(player, node):
+            player.node = node  # No track playing and no filters, DefaultPlayer sends nothing
+
+        async def run():
+            player = make_player(Node())
+            await player.set_volume(50)
+            assert player.node.updates == [{'volume': 50}]
+
+            monkeypatch.setattr(DefaultPlayer, 'change_node', change_node)
+            new_node = Node()
+            await player.change_node(new_node)
+            assert new_node.updates == [{'volume': 50}]
+
+            await player.set_volume(100)
+            assert new_node.updates[-1] == {'volume': 100}
+        asyncio.run(run())
@@ -0,0 +1,46 @@
+import asyncio
+import logging
+
+from lavalink.events import PlayerUpdateEvent, TrackEndEvent, TrackStuckEvent
+from lavalink.server import EndReason
+
+from .player import MixPlayer
+from .votes import VoteRegistry
+
+
+def make_player():
+    # The events only touch the votes and play, no Lavalink node is needed
+    player = MixPlayer.__new__(MixPlayer)
+    player.logger = logging.getLogger("musicbot").getChild("MixPlayer")
+    player.votes = VoteRegistry()
+    player.skip_voters = {1}
+    player.played = 0
+
+    async def play():
+        player.played += 1
+    player.play = play
+    return player
+
+
+class TestPlayerEvents():
+    def test_track_end(self):
+        async def run():
+            player = make_player()
+            player.votes.add('skip', 1)
+            await player.handle_event(TrackEndEvent(player, None, EndReason.FINISHED))
+            assert player.played == 1
+            assert player.skip_voters == set()
+            assert player.votes.count('skip') == 0
+
+            await player.handle_event(TrackEndEvent(player, None, EndReason.REPLACED))
+            assert player.played == 1
+        asyncio.run(run())
+
+    def test_dispatch_by_type(self):
+        async def run():
+            player = make_player()
+            await player.handle_event(TrackStuckEvent(player, None, 1000))
+            assert player.played == 1
+            await player.handle_event(PlayerUpdateEvent(player, {}))
+            assert player.played == 1
+        asyncio.run(run())
@@ -0,0 +1,90 @@
+from types import SimpleNamespace
+
+import pytest
+
+from .presets import BASS_BOOST, NIGHTCORE, FilterPresets, build_preset, parse_description, stack_filters
+
+
+class Settings():
+    def __init__(self):
+        self.presets = {}
+        self.changes = 0
+        self.reads = 0
+
+    def version(self, _guild):
+        return self.changes
+
+    def get(self, _guild, _setting, default=None):
+        self.reads += 1
+        return self.presets or default
+
+
+GUILD = SimpleNamespace(id=1)
+
+
+class TestFilterPresets():
+    def test_build_preset(self):
+        preset = build_preset('party', {'equalizer': {'bands': [[0, 0.2]]}, 'timescale': {'speed': 1.1}})
+        assert preset.filters['equalizer'].values[0] == 0.2
+        assert preset.filters['timescale'].serialize() == {'timescale': {'speed': 1.1, 'pitch': 1.0, 'rate': 1.0}}
+
+    @pytest.mark.parametrize('name, description', [
+        ('Party!', {'timescale': {}}),
+        ('off', {'timescale': {}}),
+        ('party', {}),
+        ('party', {'reverb': {}}),
+        ('party', {'equalizer': {'bands': [[20, 0.2]]}}),
+        ('party', {'timescale': [1.1]}),
+    ])
+    def test_invalid_preset(self, name, description):
+        with pytest.raises(ValueError):
+            build_preset(name, description)
+
+    def test_shared_presets(self):
+        presets = FilterPresets(Settings(), {'slowed': {'timescale': {'speed': 0.85}}, 'broken': {'reverb': {}}})
+        assert presets.get(GUILD, 'BassBoost') is BASS_BOOST
+        assert presets.get(GUILD, 'slowed').filters['timescale'].values['speed'] == 0.85
+        assert FilterPresets(Settings()).get(GUILD, 'slowed') is None
+        assert 'slowed' in presets.names(GUILD)
+        assert 'broken' not in presets.names(GUILD)
+
+    def test_guild_presets(self):
+        settings = Settings()
+        presets = FilterPresets(settings)
+        assert presets.get(GUILD, 'party') is None
+
+        settings.presets = {'party': {'timescale': {'speed': 1.1}}, 'bassboost': {'equalizer': {'bands': [[0, 0.5]]}}}
+        settings.changes += 1
+        party = presets.get(GUILD, 'party')
+        assert party.name == 'party'
+        assert presets.get(GUILD, 'bassboost') is not BASS_BOOST
+
+        reads = settings.reads
+        assert presets.get(GUILD, 'party') is party
+        assert settings.reads == reads
+
+    def test_stack_filters(self):
+        preset = build_preset('soft', {'equalizer': {'bands': [[0, -0.1], [14, -0.2]]}, 'timescale': {'speed': 0.8},
+                                       'karaoke': {}})
+        filters = dict(preset.filters)
+        stack_filters(filters, BASS_BOOST.filters)
+        stack_filters(filters, NIGHTCORE.filters)
+
+        assert filters['equalizer'].values[0] == 0.15 - 0.1
+        assert filters['equalizer'].values[2] == 0.25
+        assert filters['equalizer'].values[14] == -0.2
+        assert filters['timescale'].values == {'speed': 0.8 * 1.25, 'pitch': 1.25, 'rate': 1.0}
+        assert filters['karaoke'] is preset.filters['karaoke']
+        assert preset.filters['equalizer'].values[0] == -0.1  # The preset is left as it was
+
+        filters = {}
+        stack_filters(filters, BASS_BOOST.filters)
+        assert filters['equalizer'] is BASS_BOOST.filters['equalizer']
+
+    def test_parse_description(self):
+        description = {'timescale': {'speed': 1.2}}
+        assert parse_description('```yaml\ntimescale:\n  speed: 1.2\n```') == description
+        assert parse_description('```\ntimescale: {speed: 1.2}\n```') == description
+        assert parse_description('```timescale: {speed: 1.2}```') == description
+        assert parse_description('`timescale: {speed: 1.2}`') == description
+        assert parse_description(' timescale: {speed: 1.2} ') == description
@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+from .track_length import TrackLengthPolicy
+
+
+class Settings():
+    def __init__(self, **settings):
+        self.settings = settings
+        self.default_is_dynamic = False
+        self.changes = 0
+        self.reads = 0
+
+    def set(self, setting, value):
+        self.settings[setting] = value
+        self.changes += 1
+
+    def version(self, _guild):
+        return self.changes
+
+    def get(self, _guild, setting, default=''):
+        self.reads += 1
+        value = self.settings.get(setting)
+        if value is None:
+            return getattr(self, default) if isinstance(default, str) and hasattr(self, default) else default
+        return value
+
+
+def track(minutes, stream=False):
+    return SimpleNamespace(duration=minutes * 60 * 1000, stream=stream)
+
+
+class TestTrackLengthPolicy():
+    def test_dynamic_length(self):
+        settings = Settings(**{'duration.max': 60, 'duration.is_dynamic': True})
+        policy = TrackLengthPolicy(settings, None)
+        assert policy.max_length(0) == 60 * 60 * 1000
+        assert policy.max_length(3) == 20 * 60 * 1000
+        assert policy.max_length(10) == 10 * 60 * 1000
+
+    def test_cached_until_changed(self):
+        settings = Settings(**{'duration.max': 60})
+        policy = TrackLengthPolicy(settings, None)
+        for _ in range(10):
+            policy.max_length(2)
+        assert settings.reads == 2
+
+        settings.set('duration.is_dynamic', True)
+        assert policy.max_length(2) == 30 * 60 * 1000
+        assert policy.max_length(4) == 15 * 60 * 1000
+        assert settings.reads == 6
+
+    def test_filter(self):
+        policy = TrackLengthPolicy(Settings(**{'duration.max': 5}), None)
+        tracks = [track(3), track(6), track(1, stream=True), track(5)]
+        assert policy.filter(tracks, 1) == [tracks[0], tracks[3]]
+        assert not policy.allows(tracks[1], 1)
+        assert TrackLengthPolicy(Settings(), None).allows(track(600), 1)
@@ -0,0 +1,48 @@
+from .votes import VoteRegistry
+
+
+def make_registry(listeners=4, threshold=50):
+    votes = VoteRegistry()
+    votes.set_listener_count(listeners)
+    votes.set_threshold(threshold)
+    return votes
+
+
+class TestVoteRegistry():
+    def test_required_votes(self):
+        votes = make_registry(listeners=5, threshold=50)
+        assert votes.required == 3
+        votes.set_listener_count(4)
+        assert votes.required == 2
+        votes.set_threshold(100)
+        assert votes.required == 4
+        votes.set_listener_count(0)
+        assert votes.required == 1
+
+    def test_enough_votes(self):
+        votes = make_registry()
+        assert votes.add('skip', 1)
+        assert not votes.add('skip', 1)
+        assert not votes.enough('skip')
+        votes.add('skip', 2)
+        assert votes.enough('skip')
+        assert votes.count('skip') == 2
+        assert not votes.enough('stop')
+
+    def test_remove_member(self):
+        votes = make_registry()
+        votes.add('skip', 1)
+        votes.add('stop', 1)
+        votes.add('skip', 2)
+        votes.remove_member(1)
+        assert votes.voters('skip') == {2}
+        assert votes.voters('stop') == set()
+        assert not votes.has_voted('skip', 1)
+        votes.remove_member(3)  # Members without votes are ignored
+
+    def test_clear(self):
+        votes = make_registry()
+        votes.add('skip', 1)
+        votes.clear()
+        assert votes.count('skip') == 0
+        votes.remove_member(1)
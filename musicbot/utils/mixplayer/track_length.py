@@ -0,0 +1,44 @@
+from typing import Iterable, List, Optional, Tuple
+
+from lavalink import AudioTrack
+
+MINUTES_TO_MILLISECONDS = 60 * 1000
+
+
+class TrackLengthPolicy:
+    """
+    The longest track a guild allows in milliseconds. With a dynamic max duration the configured maximum is split
+    between the listeners, but never below MINIMUM_DYNAMIC_LENGTH minutes.
+    The limit is kept until the settings of the guild or the listener count change.
+    """
+    MINIMUM_DYNAMIC_LENGTH = 10
+
+    def __init__(self, settings, guild):
+        self.settings = settings
+        self.guild = guild
+        self._key: Optional[Tuple[int, int]] = None
+        self._max_length = float('inf')
+
+    def _compute(self, listener_count: int) -> float:
+        configured_max = self.settings.get(self.guild, 'duration.max', float('inf'))
+        is_dynamic = self.settings.get(self.guild, 'duration.is_dynamic', 'default_is_dynamic')
+        listeners = max(1, listener_count)  # Avoid division by 0
+
+        if configured_max > self.MINIMUM_DYNAMIC_LENGTH and is_dynamic:
+            return MINUTES_TO_MILLISECONDS * max(configured_max/listeners, self.MINIMUM_DYNAMIC_LENGTH)
+        return MINUTES_TO_MILLISECONDS * configured_max
+
+    def max_length(self, listener_count: int) -> float:
+        key = (self.settings.version(self.guild), listener_count)
+        if key != self._key:
+            self._key = key
+            self._max_length = self._compute(listener_count)
+        return self._max_length
+
+    def allows(self, track: AudioTrack, listener_count: int) -> bool:
+        return not track.stream and track.duration <= self.max_length(listener_count)
+
+    def filter(self, tracks: Iterable[AudioTrack], listener_count: int) -> List[AudioTrack]:
+        """The tracks that are allowed, checked against a single limit."""
+        max_length = self.max_length(listener_count)
+        return [track for track in tracks if not track.stream and track.duration <= max_length]
@@ -0,0 +1,71 @@
+import math
+from typing import AbstractSet, Dict, Set
+
+_EMPTY: AbstractSet = frozenset()
+
+
+class VoteRegistry:
+    """
+    Votes of the listeners of a player per category, e.g. the name of a voteable command.
+    Voters are tracked by member id, with the categories each member voted in kept as well, so a member leaving
+    only touches their own votes. The number of votes required is kept up to date as the listener count or
+    the threshold change, so checking a vote does not recompute it.
+    """
+    def __init__(self):
+        self._votes: Dict[str, Set[int]] = {}
+        self._member_categories: Dict[int, Set[str]] = {}
+        self._listener_count = 0
+        self._threshold = 0
+        self._required = 1
+
+    def _update_required(self):
+        # A single vote is always needed, even when nobody is listening
+        self._required = max(1, math.ceil(self._listener_count * self._threshold / 100))
+
+    def set_listener_count(self, listener_count: int):
+        if listener_count != self._listener_count:
+            self._listener_count = listener_count
+            self._update_required()
+
+    def set_threshold(self, threshold: int):
+        """threshold: the percentage of listeners that has to vote."""
+        if threshold != self._threshold:
+            self._threshold = threshold
+            self._update_required()
+
+    @property
+    def required(self) -> int:
+        return self._required
+
+    def add(self, category: str, member_id: int) -> bool:
+        """Adds the vote of a member, returns whether it is a new vote."""
+        voters = self._votes.setdefault(category, set())
+        if member_id in voters:
+            return False
+        voters.add(member_id)
+        self._member_categories.setdefault(member_id, set()).add(category)
+        return True
+
+    def remove_member(self, member_id: int):
+        for category in self._member_categories.pop(member_id, _EMPTY):
+            self._votes[category].discard(member_id)
+
+    def voters(self, category: str) -> AbstractSet[int]:
+        return self._votes.get(category, _EMPTY)
+
+    def has_voted(self, category: str, member_id: int) -> bool:
+        return member_id in self._votes.get(category, _EMPTY)
+
+    def count(self, category: str) -> int:
+        return len(self._votes.get(category, _EMPTY))
+
+    def enough(self, category: str) -> bool:
+        return self.count(category) >= self._required
+
+    def clear(self):
+        self._votes.clear()
+        self._member_categories.clear()
+
+    def __repr__(self):
+        votes = {category: len(voters) for category, voters in self._votes.items() if voters}
+        return f'<VoteRegistry votes={votes} required={self._required}>'
@@ -1,19 +1,26 @@
-import codecs
+import copy
 import locale as localee
 import os
-from typing import Any
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 
 import discord
 
-import yaml
-
 from .dictmapper import DictMapper
+from .storage import SqliteStorage, YamlStorage
+
+
+@lru_cache(maxsize=None)
+def _key_path(setting: str) -> Tuple[str, ...]:
+    """Splits a dotted setting name into a list of keys, the names used are few so the result is cached."""
+    return tuple(setting.split('.'))
 
 
 class Settings():
-    def __init__(self, datadir, **default_settings):
+    def __init__(self, datadir, backend: str = 'yaml', write_delay: float = 2.0, **default_settings):
         self._DATA_PATH = f"{datadir}/bot/"
         self._SETTINGS_PATH = self._DATA_PATH + 'settings.yaml'
+        self._DATABASE_PATH = self._DATA_PATH + 'settings.db'
 
         self.default_prefix = default_settings["prefix"]
         self.default_mod = default_settings["moderator role"]
@@ -29,12 +36,18 @@ class Settings():
         if not os.path.exists(self._DATA_PATH):
             os.makedirs(self._DATA_PATH)
 
-        if not os.path.isfile(self._SETTINGS_PATH):
-            with codecs.open(self._SETTINGS_PATH, "w+", encoding='utf8') as f:
-                yaml.dump({}, f, indent=2)
+        if backend == 'yaml':
+            self.storage = YamlStorage(self._SETTINGS_PATH, write_delay=write_delay)
+        elif backend == 'sqlite':
+            self.storage = SqliteStorage(self._DATABASE_PATH, yaml_path=self._SETTINGS_PATH)
+        else:
+            raise ValueError(f'Unknown settings backend {backend}')
 
-        with codecs.open(self._SETTINGS_PATH, "r", encoding='utf8') as f:
-            self.settings = yaml.load(f, Loader=yaml.SafeLoader)
+        # Resolved values per identifier, so repeated reads of a setting are a dictionary lookup.
+        # The view of an identifier is dropped whenever one of its settings change.
+        self._views: Dict[str, Dict[str, Any]] = {}
+        # Counts the changes to the settings of each identifier, for callers caching values derived from them.
+        self._versions: Dict[str, int] = {}
 
     def set(self, identifier, setting, value):
         """Set value in settings, will overwrite any existing values."""
@@ -43,15 +56,29 @@ class Settings():
             guild_name = identifier.name
             identifier = str(identifier.id)
 
-        if identifier not in self.settings.keys():
-            self.settings[identifier] = {}
+        # Copy on write, the stored dictionary might be in the process of being written
+        settings = copy.deepcopy(self.storage.get(identifier) or {})
 
         if guild_name:
-            self.settings[identifier]["_servername"] = guild_name
-        DictMapper.set(self.settings[identifier], setting.split('.'), value)
+            settings["_servername"] = guild_name
+        DictMapper.set(settings, _key_path(setting), value)
+
+        self.storage.set(identifier, settings)
+        self._views.pop(identifier, None)
+        self._versions[identifier] = self._versions.get(identifier, 0) + 1
+
+    def version(self, identifier) -> int:
+        """Changes whenever a setting of the identifier is set."""
+        if isinstance(identifier, discord.Guild):
+            identifier = str(identifier.id)
+        return self._versions.get(identifier, 0)
 
-        with codecs.open(self._SETTINGS_PATH, 'w', encoding='utf8') as f:
-            yaml.dump(self.settings, f, indent=2)
+    def flush(self):
+        """Writes any pending changes to disk."""
+        self.storage.flush()
+
+    def close(self):
+        self.storage.close()
 
     def get(self, identifier, setting, default: Any = '') -> Any:
         """Gets a value from the settings if a default return value is specified
@@ -61,16 +88,22 @@ class Settings():
         if isinstance(identifier, discord.Guild):
             identifier = str(identifier.id)
 
-        if default and isinstance(default, str) and hasattr(self, default):
-            default = getattr(self, default)
-        elif default == '':
-            default = None
+        try:
+            view = self._views[identifier]
+        except KeyError:
+            view = self._views[identifier] = {}
 
-        if identifier not in self.settings.keys():
-            return default
+        try:
+            value = view[setting]
+        except KeyError:
+            settings = self.storage.get(identifier)
+            value = view[setting] = DictMapper.get(settings, _key_path(setting)) if settings is not None else None
 
-        value = DictMapper.get(self.settings[identifier], setting.split('.'))
         if value is not None:
             return value
-        else:
-            return default
+
+        if default and isinstance(default, str) and hasattr(self, default):
+            return getattr(self, default)
+        elif default == '':
+            return None
+        return default
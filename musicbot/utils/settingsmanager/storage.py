@@ -0,0 +1,154 @@
+import codecs
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+from typing import Dict, Optional
+
+import yaml
+
+"""
+Storage backends for the settings manager. Backends store one settings dictionary per identifier, usually a guild id.
+"""
+
+
+class YamlStorage:
+    """Keeps every identifier in a single YAML file, loaded in full at startup.
+
+    Changes are written to disk by a background thread, at most once per write_delay seconds.
+    """
+
+    def __init__(self, path, write_delay: float = 2.0):
+        self._path = path
+        self.logger = logging.getLogger("musicbot").getChild("Settings")
+
+        self.write_delay = write_delay
+        self._dirty = False
+        self._write_timer: Optional[threading.Timer] = None
+        self._state_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+        if not os.path.isfile(self._path):
+            self._write({})
+
+        with codecs.open(self._path, "r", encoding='utf8') as f:
+            self.settings: Dict[str, dict] = yaml.load(f, Loader=yaml.SafeLoader) or {}
+
+    def get(self, identifier) -> Optional[dict]:
+        return self.settings.get(identifier)
+
+    def set(self, identifier, settings: dict):
+        # Replace instead of modifying, the background writer might be dumping the current dictionary
+        self.settings = {**self.settings, identifier: settings}
+        self._schedule_write()
+
+    def _schedule_write(self):
+        """Marks the settings as changed, changes made before the write happens are written together."""
+        with self._state_lock:
+            self._dirty = True
+            if self._write_timer is None:
+                self._write_timer = threading.Timer(self.write_delay, self.flush)
+                self._write_timer.daemon = True
+                self._write_timer.start()
+
+    def flush(self):
+        """Writes any pending changes to disk."""
+        with self._flush_lock:
+            with self._state_lock:
+                if self._write_timer is not None:
+                    self._write_timer.cancel()
+                    self._write_timer = None
+                if not self._dirty:
+                    return
+                self._dirty = False
+                settings = self.settings
+
+            try:
+                self._write(settings)
+            except Exception:
+                self.logger.exception("Failed to write settings to %s" % self._path)
+                self._schedule_write()
+
+    def _write(self, settings):
+        """Writes to a temporary file and replaces the settings file with it,
+        the settings file is never left partially written.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self._path), prefix='.settings.', suffix='.tmp')
+        os.close(fd)
+        try:
+            with codecs.open(tmp_path, 'w', encoding='utf8') as f:
+                yaml.dump(settings, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def close(self):
+        self.flush()
+
+
+class SqliteStorage:
+    """Keeps one row per identifier in an SQLite database.
+
+    Rows are loaded the first time an identifier is accessed and cached, a change only writes the changed row.
+    If a settings.yaml from the YAML backend exists next to the database and the database is empty,
+    it is imported once and renamed to settings.yaml.migrated.
+    """
+
+    def __init__(self, path, yaml_path: Optional[str] = None):
+        self._path = path
+        self.logger = logging.getLogger("musicbot").getChild("Settings")
+        self._cache: Dict[str, Optional[dict]] = {}
+
+        self._connection = sqlite3.connect(self._path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS settings "
+                                 "(identifier TEXT PRIMARY KEY, data TEXT NOT NULL)")
+        self._connection.commit()
+
+        if yaml_path and os.path.isfile(yaml_path):
+            self._migrate_from_yaml(yaml_path)
+
+    def _migrate_from_yaml(self, yaml_path):
+        if self._connection.execute("SELECT 1 FROM settings LIMIT 1").fetchone():
+            self.logger.warning("Not importing %s, the settings database is not empty" % yaml_path)
+            return
+
+        with codecs.open(yaml_path, "r", encoding='utf8') as f:
+            settings = yaml.load(f, Loader=yaml.SafeLoader) or {}
+
+        with self._connection:
+            self._connection.executemany("INSERT INTO settings (identifier, data) VALUES (?, ?)",
+                                         [(str(k), json.dumps(v)) for k, v in settings.items()])
+        os.replace(yaml_path, yaml_path + '.migrated')
+        self.logger.info("Imported settings for %s identifiers from %s" % (len(settings), yaml_path))
+
+    def get(self, identifier) -> Optional[dict]:
+        try:
+            return self._cache[identifier]
+        except KeyError:
+            pass
+
+        row = self._connection.execute("SELECT data FROM settings WHERE identifier = ?", (identifier,)).fetchone()
+        settings = json.loads(row[0]) if row else None
+        self._cache[identifier] = settings
+        return settings
+
+    def set(self, identifier, settings: dict):
+        with self._connection:
+            self._connection.execute("INSERT INTO settings (identifier, data) VALUES (?, ?) "
+                                     "ON CONFLICT(identifier) DO UPDATE SET data = excluded.data",
+                                     (identifier, json.dumps(settings)))
+        self._cache[identifier] = settings
+
+    def flush(self):
+        """Changes are committed as they are made, nothing to write."""
+        pass
+
+    def close(self):
+        self._connection.close()
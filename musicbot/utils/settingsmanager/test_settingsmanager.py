@@ -0,0 +1,139 @@
+import os
+
+import yaml
+
+from .settingsmanager import Settings
+
+default_settings = {
+    "prefix": ["!"],
+    "moderator role": "Moderator",
+    "locale": "en_en",
+    "threshold": 50,
+    "dynamic max duration": True,
+}
+
+
+def read_settings_file(datadir):
+    with open(os.path.join(datadir, "bot", "settings.yaml"), encoding="utf8") as f:
+        return yaml.load(f, Loader=yaml.SafeLoader)
+
+
+class TestYamlSettings():
+    def test_set_is_written_on_flush(self, tmp_path):
+        settings = Settings(tmp_path, write_delay=60, **default_settings)
+        settings.set("1", "roles.dj", [2])
+        assert read_settings_file(tmp_path) == {}
+
+        settings.flush()
+        assert read_settings_file(tmp_path) == {"1": {"roles": {"dj": [2]}}}
+
+    def test_writes_are_coalesced(self, tmp_path):
+        settings = Settings(tmp_path, write_delay=60, **default_settings)
+        writes = []
+        write = settings.storage._write
+        settings.storage._write = lambda d: (writes.append(d), write(d))
+
+        settings.set("1", "vote_threshold", 10)
+        settings.set("1", "vote_threshold", 20)
+        settings.set("2", "prefixes", ["?"])
+        settings.flush()
+        settings.flush()
+
+        assert len(writes) == 1
+        assert read_settings_file(tmp_path) == {"1": {"vote_threshold": 20}, "2": {"prefixes": ["?"]}}
+
+    def test_no_temporary_files_left(self, tmp_path):
+        settings = Settings(tmp_path, write_delay=60, **default_settings)
+        settings.set("1", "locale", "nb_no")
+        settings.flush()
+        assert os.listdir(os.path.join(tmp_path, "bot")) == ["settings.yaml"]
+
+    def test_snapshot_not_modified_by_set(self, tmp_path):
+        settings = Settings(tmp_path, write_delay=60, **default_settings)
+        settings.set("1", "duration.max", 10)
+        snapshot = settings.storage.settings
+        settings.set("1", "duration.max", 20)
+        assert snapshot == {"1": {"duration": {"max": 10}}}
+        assert settings.get("1", "duration.max") == 20
+
+    def test_reload(self, tmp_path):
+        settings = Settings(tmp_path, write_delay=60, **default_settings)
+        settings.set("1", "channels.text", [1, 2, 3])
+        settings.close()
+
+        reloaded = Settings(tmp_path, **default_settings)
+        assert reloaded.get("1", "channels.text") == [1, 2, 3]
+
+
+class TestSqliteSettings():
+    def test_set_and_get(self, tmp_path):
+        settings = Settings(tmp_path, backend='sqlite', **default_settings)
+        settings.set("1", "roles.dj", [2])
+        settings.set("1", "vote_threshold", 20)
+
+        assert settings.get("1", "roles.dj") == [2]
+        assert settings.get("1", "vote_threshold") == 20
+        assert settings.get("2", "vote_threshold", "default_threshold") == 50
+
+    def test_reload(self, tmp_path):
+        settings = Settings(tmp_path, backend='sqlite', **default_settings)
+        settings.set("1", "channels.text", [1, 2, 3])
+        settings.close()
+
+        reloaded = Settings(tmp_path, backend='sqlite', **default_settings)
+        assert reloaded.get("1", "channels.text") == [1, 2, 3]
+
+    def test_migrate_from_yaml(self, tmp_path):
+        settings = Settings(tmp_path, **default_settings)
+        settings.set("1", "prefixes", ["?"])
+        settings.set("lavalink", "nodes", [{"name": "main", "port": 2333}])
+        settings.close()
+
+        migrated = Settings(tmp_path, backend='sqlite', **default_settings)
+        assert migrated.get("1", "prefixes") == ["?"]
+        assert migrated.get("lavalink", "nodes") == [{"name": "main", "port": 2333}]
+        assert not os.path.isfile(os.path.join(tmp_path, "bot", "settings.yaml"))
+        migrated.close()
+
+        # The migration only happens once
+        migrated = Settings(tmp_path, backend='sqlite', **default_settings)
+        assert migrated.get("1", "prefixes") == ["?"]
+
+
+class TestSettingsView():
+    def test_view_updated_on_set(self, tmp_path):
+        settings = Settings(tmp_path, write_delay=60, **default_settings)
+        assert settings.get("1", "prefixes", "default_prefix") == ["!"]
+
+        settings.set("1", "prefixes", ["?"])
+        assert settings.get("1", "prefixes", "default_prefix") == ["?"]
+
+        settings.set("1", "prefixes", None)
+        assert settings.get("1", "prefixes", "default_prefix") == ["!"]
+
+    def test_defaults(self, tmp_path):
+        settings = Settings(tmp_path, write_delay=60, **default_settings)
+        settings.set("1", "duration.max", 10)
+
+        assert settings.get("1", "duration.is_dynamic", "default_is_dynamic") is True
+        assert settings.get("1", "channels.text", []) == []
+        assert settings.get("1", "channels.text") is None
+        assert settings.get("2", "duration.max", float('inf')) == float('inf')
+        assert settings.get("1", "duration.max", float('inf')) == 10
+
+    def test_parent_setting_changed(self, tmp_path):
+        settings = Settings(tmp_path, write_delay=60, **default_settings)
+        settings.set("1", "channels.text", [1])
+        assert settings.get("1", "channels") == {"text": [1]}
+
+        settings.set("1", "channels.music", [2])
+        assert settings.get("1", "channels") == {"text": [1], "music": [2]}
+        assert settings.get("1", "channels.text") == [1]
+
+    def test_version_changes_on_set(self, tmp_path):
+        settings = Settings(tmp_path, write_delay=60, **default_settings)
+        assert settings.version("1") == 0
+        settings.set("1", "duration.max", 10)
+        settings.set("1", "duration.max", 10)
+        assert settings.version("1") == 2
+        assert settings.version("2") == 0
@@ -0,0 +1,81 @@
+import asyncio
+
+from aiohttp import web
+
+from musicbot.utils.httpclient import HttpClient
+
+
+async def serve(handler):
+    app = web.Application()
+    app.router.add_get('/', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f'http://127.0.0.1:{port}/'
+
+
+class TestHttpClient():
+    def test_retries_with_backoff(self):
+        async def run():
+            calls = []
+
+            async def handler(_request):
+                calls.append(1)
+                if len(calls) < 3:
+                    return web.Response(status=503)
+                return web.json_response({'ok': True})
+
+            runner, url = await serve(handler)
+            client = HttpClient(retries=2, backoff=0.01)
+            try:
+                response = await client.get(url)
+                assert response.status == 200
+                assert response.json() == {'ok': True}
+                stats = client.stats['127.0.0.1']
+                assert (stats.requests, stats.retries, stats.failures) == (3, 2, 0)
+            finally:
+                await client.close()
+                await runner.cleanup()
+        asyncio.run(run())
+
+    def test_out_of_retries(self):
+        async def run():
+            async def handler(_request):
+                return web.Response(status=500, text='broken')
+
+            runner, url = await serve(handler)
+            client = HttpClient(retries=1, backoff=0.01)
+            try:
+                response = await client.get(url)
+                assert response.status == 500
+                assert response.text() == 'broken'
+                assert client.stats['127.0.0.1'].failures == 1
+            finally:
+                await client.close()
+                await runner.cleanup()
+        asyncio.run(run())
+
+    def test_per_host_limit(self):
+        async def run():
+            active = []
+            most_active = []
+
+            async def handler(_request):
+                active.append(1)
+                most_active.append(len(active))
+                await asyncio.sleep(0.02)
+                active.pop()
+                return web.Response(text='ok')
+
+            runner, url = await serve(handler)
+            client = HttpClient(max_per_host=2)
+            try:
+                responses = await asyncio.gather(*(client.get(url) for _ in range(6)))
+                assert all(response.text() == 'ok' for response in responses)
+                assert max(most_active) == 2
+            finally:
+                await client.close()
+                await runner.cleanup()
+        asyncio.run(run())
@@ -11,9 +11,10 @@ class Thumbnailer(object):
         self.logger = self.bot.main_logger.bot_logger.getChild("Thumbnailer")
 
     async def get_html(self, url: str):
-        async with self.bot.session.get(url, timeout=3) as response:
-            assert response.status == 200
-            return await response.read()
+        # Thumbnails are best effort, a slow host must not hold up enqueueing
+        response = await self.bot.http_client.get(url, timeout=3, retries=0)
+        assert response.status == 200
+        return response.body
 
     async def _soundcloud(self, url: str) -> str:
         perf_start = perf_counter()
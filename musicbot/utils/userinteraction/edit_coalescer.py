@@ -0,0 +1,54 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+import discord
+
+
+class EditCoalescer:
+    """
+    Merges edits of a message requested in quick succession. The message is edited with the state at the time the
+    edit is sent, so the latest state wins, and there is never more than one edit in flight.
+    """
+    def __init__(self, edit: Callable[[], Awaitable], delay: float = 0.1):
+        """edit: sends the current state, delay: how long to wait for more requests before editing."""
+        self._edit = edit
+        self._delay = delay
+        self._pending = False
+        self._editing = False
+        self._task: Optional[asyncio.Task] = None
+        self.logger = logging.getLogger("musicbot").getChild("EditCoalescer")
+
+    def request(self):
+        """Edits the message soon, without waiting for it."""
+        self._pending = True
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while self._pending:
+            await asyncio.sleep(self._delay)
+            self._pending = False
+            self._editing = True
+            try:
+                await self._edit()
+            except discord.HTTPException as err:
+                self.logger.debug("Could not edit message: %s", err)
+            except Exception:
+                self.logger.exception("Editing the message failed")
+            finally:
+                self._editing = False
+
+    async def cancel(self):
+        """Drops requested edits, an edit already in flight is waited for. Never raises, errors are logged."""
+        self._pending = False
+        if self._task is None or self._task.done():
+            return
+        if not self._editing:
+            self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            self.logger.exception("Editing the message failed")
@@ -1,37 +1,96 @@
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Tuple
+
+import discord
+
+
 class CantScrollError(Exception):
     pass
 
 
 class BasePaginator:
-    def __init__(self, max_size=2000, max_units=10):
-        self._pages = []
+    """
+    Pages are stored as their content and rendered to embeds when they are displayed, usually only a few of them are.
+    The last rendered pages are cached, pages fetched through `pages` are all rendered and kept for good.
+    """
+    def __init__(self, max_size=2000, max_units=10, cached_pages=8):
+        # (renderer, content) of each closed page
+        self._pages: List[Tuple[Callable[[Any], discord.Embed], Any]] = []
         self._current_page_size = 0
         self._current_units = 0
         self._max_size = max_size
         self._max_units = max_units
 
+        self._page_indicator: Optional[Tuple[Any, Optional[str], dict]] = None
+        self._rendered: OrderedDict[int, discord.Embed] = OrderedDict()
+        self._cached_pages = cached_pages
+        self._kept: List[discord.Embed] = []
+
     def close_page(self):
         pass
 
-    def add_page_indicator(self, localizer, localizer_str=None, **kvpairs):
-        self.close_page()
+    def _add_page(self, content):
+        self._pages.append((self._render_page, content))
+
+    def _render_page(self, content) -> discord.Embed:
+        """Builds the embed of a page from its content."""
+        return content
+
+    def _render(self, index) -> discord.Embed:
+        renderer, content = self._pages[index]
+        page = renderer(content)
+        if self._page_indicator:
+            self._set_page_indicator(page, index)
+        return page
+
+    def _set_page_indicator(self, page: discord.Embed, index):
+        localizer, localizer_str, kvpairs = self._page_indicator
         if localizer_str:
-            for i, page in enumerate(self._pages, start=1):
-                page.set_footer(text=localizer.format_str(localizer_str, _current=i,
-                                                          _total=len(self._pages), **kvpairs))
+            page.set_footer(text=localizer.format_str(localizer_str, _current=index + 1,
+                                                      _total=len(self._pages), **kvpairs))
         else:
-            for i, page in enumerate(self._pages, start=1):
-                page.set_footer(text=f"{i}/{len(self._pages)}")
+            page.set_footer(text=f"{index + 1}/{len(self._pages)}")
+
+    def add_page_indicator(self, localizer, localizer_str=None, **kvpairs):
+        self.close_page()
+        self._page_indicator = (localizer, localizer_str, kvpairs)
+        self._rendered.clear()
+        for index, page in enumerate(self._kept):
+            self._set_page_indicator(page, index)
 
     def append_paginator(self, paginator):
         if not isinstance(paginator, BasePaginator):
             raise TypeError('Paginator needs to be a subclass of BasePaginator.')
         self.close_page()
-        for page in paginator.pages:
-            self.pages.append(page)
+        paginator.close_page()
+        # Pages are still rendered by the paginator they were added to, using its embed base
+        self._pages.extend(paginator._pages)
 
     @property
-    def pages(self):
+    def page_count(self) -> int:
         if self._current_page_size > 0:
             self.close_page()
-        return self._pages
+        return len(self._pages)
+
+    def get_page(self, index) -> discord.Embed:
+        """Renders a single page, or returns it from the cache."""
+        if index < len(self._kept):
+            return self._kept[index]
+        if (page := self._rendered.get(index)) is not None:
+            self._rendered.move_to_end(index)
+            return page
+
+        if index >= self.page_count:
+            raise IndexError('Page index out of range')
+        page = self._rendered[index] = self._render(index)
+        if len(self._rendered) > self._cached_pages:
+            self._rendered.popitem(last=False)
+        return page
+
+    @property
+    def pages(self) -> List[discord.Embed]:
+        """Every page rendered. The embeds are kept, so changes made to them stick."""
+        for index in range(len(self._kept), self.page_count):
+            page = self._rendered.pop(index, None)
+            self._kept.append(page if page is not None else self._render(index))
+        return self._kept
@@ -7,14 +7,20 @@ class FieldPaginator(BasePaginator):
     def __init__(self, max_size=5000, max_fields=8, **embed_base):
         super().__init__(max_size=max_size, max_units=max_fields)
         self._embed_base = embed_base
-        self._current_page = discord.Embed(**self._embed_base)
+        self._current_page = []
 
     def close_page(self):
         if self._current_page_size > 0:
-            self._pages.append(self._current_page)
+            self._add_page(self._current_page)
             self._current_page_size = 0
             self._current_units = 0
-            self._current_page = discord.Embed(**self._embed_base)
+            self._current_page = []
+
+    def _render_page(self, fields):
+        page = discord.Embed(**self._embed_base)
+        for field in fields:
+            page.add_field(**field)
+        return page
 
     def add_field(self, name, value, inline=False):
         field = {"name": name, "value": value}
@@ -31,4 +37,4 @@ class FieldPaginator(BasePaginator):
         field["inline"] = inline
         self._current_page_size += fieldsize
         self._current_units += 1
-        self._current_page.add_field(**field)
+        self._current_page.append(field)
@@ -1,5 +1,3 @@
-import discord
-
 from .fieldpaginator import FieldPaginator
 
 
@@ -8,10 +6,10 @@ class HelpPaginator(FieldPaginator):
         super().__init__(**kwargs)
 
     def force_close_page(self):
-        self._pages.append(self._current_page)
+        self._add_page(self._current_page)
         self._current_page_size = 0
         self._current_units = 0
-        self._current_page = discord.Embed(**self._embed_base)
+        self._current_page = []
 
     def add_command_field(self, cmd_dict):
         if not isinstance(cmd_dict, dict):
@@ -22,18 +22,34 @@ class QueuePaginator(TextPaginator):
 
             super().__init__(max_lines=10, **{"color": color, "title": title})
 
-            # The user queues also inclue the global position of the tracks
+            # The user queues also inclue the global position of the tracks.
+            # Lines are formatted when their page is rendered, the size of a line is known without formatting it.
+            overhead = self._line_overhead("{queue.usertrack}", _index=len(member_queue),
+                                           _globalindex=max((pos + 1 for _, pos in member_queue), default=0))
             for index, (track, global_pos) in enumerate(member_queue):
-                queued_track = localizer.format_str("{queue.usertrack}", _index=index+1, _globalindex=global_pos+1,
-                                                    _title=track.title, _uri=track.uri)
-                self.add_line(queued_track)
+                self._add_entry((index, global_pos, track), overhead + len(track.title) + len(track.uri))
         else:
             queue = player.global_queue()
             title = localizer.format_str("{queue.length}", _length=len(queue), _duration=duration)
 
             super().__init__(max_lines=10, **{"color": color, "title": title})
-            for index, track in enumerate(queue, start=1):
-                queued_track = localizer.format_str("{queue.globaltrack}", _index=index,  _title=track.title,
-                                                    _uri=track.uri, _user_id=track.requester)
-                self.add_line(queued_track)
+            overhead = self._line_overhead("{queue.globaltrack}", _index=len(queue), _user_id='')
+            for index, track in enumerate(queue):
+                size = overhead + len(track.title) + len(track.uri) + len(str(track.requester))
+                self._add_entry((index, None, track), size)
         self.add_page_indicator(self.localizer, "{queue.pageindicator}")
+
+    def _line_overhead(self, localizer_str, **kvpairs) -> int:
+        """The length of a line without the title and uri of its track, at most."""
+        return len(self.localizer.format_str(localizer_str, _title='', _uri='', **kvpairs))
+
+    def _render_page(self, entries):
+        lines = []
+        for index, global_pos, track in entries:
+            if global_pos is None:
+                lines.append(self.localizer.format_str("{queue.globaltrack}", _index=index+1, _title=track.title,
+                                                       _uri=track.uri, _user_id=track.requester))
+            else:
+                lines.append(self.localizer.format_str("{queue.usertrack}", _index=index+1, _globalindex=global_pos+1,
+                                                       _title=track.title, _uri=track.uri))
+        return super()._render_page(lines)
@@ -0,0 +1,102 @@
+from types import SimpleNamespace
+
+import discord
+
+from .helppaginator import HelpPaginator
+from .queuepaginator import QueuePaginator
+from .textpaginator import TextPaginator
+
+
+class CountingLocalizer():
+    def __init__(self):
+        self.calls = 0
+
+    def format_str(self, s, **kvpairs):
+        self.calls += 1
+        return s.format(**kvpairs)
+
+
+class QueueLocalizer(CountingLocalizer):
+    strings = {'{queue.length}': '{_length} tracks', '{queue.pageindicator}': '{_current}/{_total}',
+               '{queue.globaltrack}': '{_index}. {_title} {_uri} {_user_id}'}
+
+    def format_str(self, s, **kvpairs):
+        return super().format_str(self.strings[s], **kvpairs)
+
+
+class QueuePlayer():
+    def __init__(self, tracks=95):
+        self.tracks = [SimpleNamespace(title=f'track {i}', uri=f'https://example.com/{i}', requester=1)
+                       for i in range(tracks)]
+
+    def queue_duration(self, **_):
+        return '01:00'
+
+    def global_queue(self):
+        return self.tracks
+
+
+def make_paginator(lines=100):
+    paginator = TextPaginator(max_lines=10, title='Queue')
+    for i in range(lines):
+        paginator.add_line(f'line {i}')
+    return paginator
+
+
+class TestLazyPaginator():
+    def test_page_count_without_rendering(self):
+        localizer = CountingLocalizer()
+        paginator = make_paginator(95)
+        paginator.add_page_indicator(localizer, '{_current}/{_total}')
+        assert paginator.page_count == 10
+        assert localizer.calls == 0
+
+    def test_get_page(self):
+        localizer = CountingLocalizer()
+        paginator = make_paginator()
+        paginator.add_page_indicator(localizer, '{_current}/{_total}')
+
+        page = paginator.get_page(3)
+        assert page.title == 'Queue'
+        assert page.description == '\n'.join(f'line {i}' for i in range(30, 40))
+        assert page.footer.text == '4/10'
+        assert paginator.get_page(3) is page
+        assert localizer.calls == 1
+
+    def test_rendered_pages_are_bounded(self):
+        paginator = make_paginator()
+        first = paginator.get_page(0)
+        for i in range(1, paginator.page_count):
+            paginator.get_page(i)
+        assert len(paginator._rendered) == paginator._cached_pages
+        assert paginator.get_page(0) is not first
+        assert paginator.get_page(0).description == first.description
+
+    def test_changes_to_pages_stick(self):
+        paginator = make_paginator()
+        paginator.pages[0].title = 'Lyrics'
+        paginator.add_page_indicator(CountingLocalizer())
+        assert paginator.get_page(0).title == 'Lyrics'
+        assert paginator.get_page(0).footer.text == '1/10'
+
+    def test_append_paginator(self):
+        first = HelpPaginator(max_fields=2, title='Music')
+        second = HelpPaginator(max_fields=2, title='Misc')
+        for paginator in (first, second):
+            for i in range(3):
+                paginator.add_command_field({'aliases': [f'cmd{i}'], 'description': 'description'})
+
+        first.append_paginator(second)
+        first.add_page_indicator(CountingLocalizer(), '{_current}/{_total}')
+        assert [page.title for page in first.pages] == ['Music', 'Music', 'Misc', 'Misc']
+        assert [page.footer.text for page in first.pages] == ['1/4', '2/4', '3/4', '4/4']
+
+    def test_queue_lines_formatted_when_rendered(self):
+        localizer = QueueLocalizer()
+        paginator = QueuePaginator(localizer, QueuePlayer(), discord.Color.default())
+        assert paginator.page_count == 10
+        calls = localizer.calls
+
+        page = paginator.get_page(9)
+        assert page.description == '\n'.join(f'{i + 1}. track {i} https://example.com/{i} 1' for i in range(90, 95))
+        assert localizer.calls == calls + 6  # Five lines and the page indicator
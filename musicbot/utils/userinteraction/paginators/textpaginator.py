@@ -11,28 +11,34 @@ class TextPaginator(BasePaginator):
 
     def close_page(self):
         if self._current_page_size > 0:
-            embed = discord.Embed(**self.embed_base)
-            embed.description = '\n'.join(self._current_page)
-            self._pages.append(embed)
-
+            self._add_page(self._current_page)
             self._current_page_size = 0
             self._current_units = 0
             self._current_page = []
 
+    def _render_page(self, lines):
+        embed = discord.Embed(**self.embed_base)
+        embed.description = '\n'.join(lines)
+        return embed
+
     def add_line(self, line='', *, empty=False):
         if len(line) > self._max_size:
             raise RuntimeError(f'Line exceeds maximum page size {self._max_size}')
 
-        if self._current_page_size + len(line) + 1 > self._max_size:
+        self._add_entry(line, len(line))
+
+        if empty:
+            self._current_page.append('')
+            self._current_page_size += 1
+
+    def _add_entry(self, entry, size):
+        """Adds an entry taking up size characters, subclasses may add entries that are turned into lines later."""
+        if self._current_page_size + size + 1 > self._max_size:
             self.close_page()
 
         if self._current_units >= self._max_units:
             self.close_page()
 
-        self._current_page_size += len(line) + 1
+        self._current_page_size += size + 1
         self._current_units += 1
-        self._current_page.append(line)
-
-        if empty:
-            self._current_page.append('')
-            self._current_page_size += 1
+        self._current_page.append(entry)
@@ -8,6 +8,7 @@ import discord
 
 from bot import MusicBot
 
+from .edit_coalescer import EditCoalescer
 from .navbar_range import NavBarRange
 from .paginators import BasePaginator, CantScrollError
 
@@ -43,19 +44,21 @@ class Scroller:
         self.ctx = ctx
 
         # No embeds to scroll through
-        if not self.paginator.pages:
+        if not self.paginator.page_count:
             raise Exception("Paginator contained no pages to display")  # TODO: proper error
 
         self.bot: MusicBot = ctx.bot
         self.channel = ctx.channel
         self.message: Optional[discord.Message] = None
+        # Clicks in quick succession result in a single edit showing the last page clicked to
+        self.edits = EditCoalescer(self.update_message)
 
         # Initialize the view we'll be using for scrolling
         self.view = discord.ui.View(timeout=timeout)
         self.view.on_timeout = self.on_timeout
 
-        self.is_scrolling_paginator = len(self.paginator.pages) > 1
-        self.use_nav_bar = len(self.paginator.pages) > 3
+        self.is_scrolling_paginator = self.paginator.page_count > 1
+        self.use_nav_bar = self.paginator.page_count > 3
         self.scrolling_done = asyncio.Event()
 
         stop_emoji = '✔️' if use_tick_for_stop_emoji else '❌'
@@ -75,7 +78,7 @@ class Scroller:
 
         # Determine which buttons should be visible depending on the number of pages
         if (self.is_scrolling_paginator):
-            if (len(self.paginator.pages) > 2):
+            if (self.paginator.page_count > 2):
                 self.control_buttons = [first_page_button, self.back_button, self.forward_button,
                                         last_page_button, self.stop_button]
             else:
@@ -96,7 +99,7 @@ class Scroller:
                               message: Optional[discord.Message] = None,
                               start_page: int = 0) -> Tuple[discord.Message, bool]:
         self.clear_mode = clear_mode
-        self.page_number = min(start_page, len(self.paginator.pages))
+        self.page_number = min(start_page, self.paginator.page_count - 1)
         self.build_view()
         self.update_view()
         if message:
@@ -116,7 +119,7 @@ class Scroller:
 
         if self.is_scrolling_paginator:
             self.back_button.disabled = self.page_number == 0
-            self.forward_button.disabled = self.page_number == len(self.paginator.pages)-1
+            self.forward_button.disabled = self.page_number == self.paginator.page_count-1
 
     def build_view(self):
         for button in self.control_buttons:
@@ -127,10 +130,10 @@ class Scroller:
             self._update_navbar_items()
 
     def _update_navbar_items(self):
-        placeholder = f"Page: {self.page_number + 1}/{len(self.paginator.pages)}"
+        placeholder = f"Page: {self.page_number + 1}/{self.paginator.page_count}"
         did_exist = False
         # If we have more than 25 items, the navigator needs to be re-created.
-        num_selectable_items = len(self.paginator.pages)
+        num_selectable_items = self.paginator.page_count
         if num_selectable_items > DISCORD_MAX_SELECTOR_OPTIONS and self.navigator is not None:
             self.view.remove_item(self.navigator)
             self.navigator = None
@@ -153,6 +156,7 @@ class Scroller:
     async def stop(self, was_timeout: bool, clear_scroller_view: bool = True):
         self.is_scrolling_paginator = False
         self.view.stop()
+        await self.edits.cancel()
         if clear_scroller_view:
             self.view.clear_items()
         self.timed_out = was_timeout
@@ -179,15 +183,16 @@ class Scroller:
         if interaction.user.id != self.ctx.author.id:
             return await interaction.response.defer()
 
-        if page < 0 or page >= len(self.paginator.pages):
+        # Acknowledge right away, the message is edited when no edit is in flight
+        await interaction.response.defer()
+        if page < 0 or page >= self.paginator.page_count:
             return
         self.page_number = page
 
         if interaction.message:
             # Update the view before we edit the message
             self.update_view_on_interaction(interaction)
-            await self.update_message()
-        await interaction.response.defer()
+            self.edits.request()
 
     async def update_message(self):
         if self.message:
@@ -197,7 +202,7 @@ class Scroller:
         await self._scroll(0, interaction)
 
     async def last_page(self, interaction: discord.Interaction):
-        await self._scroll(len(self.paginator.pages) - 1, interaction)
+        await self._scroll(self.paginator.page_count - 1, interaction)
 
     async def next_page(self, interaction: discord.Interaction):
         await self._scroll(self.page_number + 1, interaction)
@@ -217,4 +222,4 @@ class Scroller:
 
     @property
     def current_page_embed(self):
-        return self.paginator.pages[self.page_number]
+        return self.paginator.get_page(self.page_number)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import math
 from enum import Enum, auto
-from typing import Callable, Coroutine, List, Optional
+from typing import Any, Callable, Coroutine, Dict, Optional, Sequence
 
 import discord
 
@@ -47,61 +48,106 @@ class SelectorItem:
         self.callback = callback
 
 
+class SelectorItems(Sequence):
+    """
+    Choices made from a list of items as they are displayed, instead of all of them up front.
+    The items are copied, a choice keeps pointing at the same item if the list changes while the selector is open.
+    """
+    def __init__(self, items: Sequence, make_choice: Callable[[int, Any], SelectorItem]):
+        self.items = list(items)
+        self.make_choice = make_choice
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.make_choice(i, self.items[i]) for i in range(*index.indices(len(self.items)))]
+        if index < 0:
+            index += len(self.items)
+        return self.make_choice(index, self.items[index])
+
+
 class Selector(TextPaginator, Scroller):
-    def __init__(self, ctx, choices: List[SelectorItem], select_mode: SelectMode,
+    """
+    Scroller with a button per choice. Only the choices on the displayed page get text and buttons, the buttons are
+    reused for every page and the styles set by callbacks are kept per choice.
+    """
+    def __init__(self, ctx, choices: Sequence[SelectorItem], select_mode: SelectMode,
                  use_tick_for_stop_emoji: bool = False, max_size=2000, default_text=" ", **embed_base):
 
         self.selector_mode: SelectMode = select_mode
 
         self.selections_per_page = 5
         self.selections = choices
+        self.default_text = default_text
 
         TextPaginator.__init__(self, max_size=max_size, max_lines=self.selections_per_page, **embed_base)
-        for selection in self.selections:
-            if (selection.identifier):
-                self.add_line(selection.identifier)
-        if len(self.pages) == 0:
-            self.add_line(default_text)
-        self.close_page()
 
         Scroller.__init__(self, ctx, self, use_tick_for_stop_emoji=use_tick_for_stop_emoji,
                           show_cancel_for_single_page=True)
 
-        # Contains a list of all buttons that can be interacted with, both
-        # currently visible and not.
-        self.buttons = []
-
-        # The list of currently visible buttons, gets cleared upon scroll.
-        self.currently_visible_buttons = []
+        # Styles set by the callbacks by choice index, choices not in here have the default style
+        self.button_styles: Dict[int, discord.ButtonStyle] = {}
 
         # Depending on the selector we might want the result of calculations in
         # the callbacks after we have finished interacting with the scroller
         self.callback_results = []
 
-        # Wrap the provided so that we can both update the view if needed
-        # or terminate the selection process upon interaction
-        def with_update_view(func):
-            async def wrapped_callback(interaction: discord.Interaction, button: SelectorButton):
-                if (interaction.user.id != ctx.author.id):
-                    return await interaction.response.defer()
-
-                result = await func(interaction, button)
-                self.callback_results.append(result)
-                self.update_view_on_interaction(interaction)
-                await interaction.response.defer()
-
-                match self.selector_mode:
-                    case SelectMode.SingleSelect:
-                        await self.stop(was_timeout=False, clear_scroller_view=True)
-                    case SelectMode.SpanningMultiSelect:
-                        await self.stop(was_timeout=False, clear_scroller_view=False)
-                    case _:
-                        await self.update_message()
+        # Call the callback of the choice shown on the button, then either update the view
+        # or terminate the selection process
+        async def with_update_view(interaction: discord.Interaction, button: SelectorButton):
+            # Acknowledge right away, the message is edited when no edit is in flight
+            await interaction.response.defer()
+            if (interaction.user.id != ctx.author.id):
+                return
+
+            # The clicked message may still show an earlier page, the custom id names the choice it showed
+            index = self._choice_index(interaction.data['custom_id'])
+            button.style = self.button_styles.get(index, discord.ButtonStyle.gray)
+            result = await self.selections[index].callback(interaction, button)
+            if button.style == discord.ButtonStyle.gray:
+                self.button_styles.pop(index, None)
+            else:
+                self.button_styles[index] = button.style
+            self.callback_results.append(result)
+            self.update_view_on_interaction(interaction)
+
+            match self.selector_mode:
+                case SelectMode.SingleSelect:
+                    await self.stop(was_timeout=False, clear_scroller_view=True)
+                case SelectMode.SpanningMultiSelect:
+                    await self.stop(was_timeout=False, clear_scroller_view=False)
+                case _:
+                    self.edits.request()
+
+        # One button per choice on a page, given the label, style and custom id of the choice it shows when scrolling
+        self.buttons = [SelectorButton('', with_update_view, row=0)
+                        for _ in range(min(self.selections_per_page, len(self.selections)))]
+
+        # The list of currently visible buttons, changes when scrolling to a page with fewer choices.
+        self.currently_visible_buttons = []
 
-            return wrapped_callback
+    @property
+    def page_count(self):
+        return max(1, math.ceil(len(self.selections) / self.selections_per_page))
+
+    def _page_selections(self, page_number):
+        start = page_number * self.selections_per_page
+        return self.selections[start:start + self.selections_per_page]
 
-        for choice in self.selections:
-            self.buttons.append(SelectorButton(choice.button_label, with_update_view(choice.callback), row=0))
+    def _choice_index(self, custom_id: str) -> int:
+        return int(custom_id.rpartition(':')[2])
+
+    def _fit_line(self, line: str) -> str:
+        # Every page holds selections_per_page lines, each line gets an equal share of the page
+        line_size = self._max_size // self.selections_per_page - 1
+        return line if len(line) <= line_size else line[:line_size - 1] + '…'
+
+    def _render(self, index):
+        lines = [self._fit_line(selection.identifier) for selection in self._page_selections(index)
+                 if selection.identifier]
+        return self._render_page(lines or [self.default_text])
 
     def build_view(self):
         super().build_view()
@@ -117,9 +163,11 @@ class Selector(TextPaginator, Scroller):
 
         self.currently_visible_buttons = []
         start = self.page_number * self.selections_per_page
-        end = min((self.page_number + 1) * self.selections_per_page, len(self.selections))
-
-        for button in self.buttons[start:end]:
+        for slot, selection in enumerate(self._page_selections(self.page_number)):
+            button = self.buttons[slot]
+            button.label = selection.button_label
+            button.style = self.button_styles.get(start + slot, discord.ButtonStyle.gray)
+            button.custom_id = f'selector:{start + slot}'
             self.view.add_item(item=button)
             self.currently_visible_buttons.append(button)
 
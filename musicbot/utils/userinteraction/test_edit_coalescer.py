@@ -0,0 +1,87 @@
+import asyncio
+
+from .edit_coalescer import EditCoalescer
+
+
+class Message():
+    def __init__(self):
+        self.state = 0
+        self.edits = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def edit(self):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.edits.append(self.state)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+
+class TestEditCoalescer():
+    def test_burst_is_one_edit(self):
+        async def run():
+            message = Message()
+            edits = EditCoalescer(message.edit, delay=0.01)
+            for state in range(1, 11):
+                message.state = state
+                edits.request()
+            await asyncio.sleep(0.05)
+            assert message.edits == [10]
+        asyncio.run(run())
+
+    def test_requests_during_edit(self):
+        async def run():
+            message = Message()
+            edits = EditCoalescer(message.edit, delay=0)
+            message.state = 1
+            edits.request()
+            await asyncio.sleep(0.005)  # First edit in flight
+            for state in range(2, 6):
+                message.state = state
+                edits.request()
+            await asyncio.sleep(0.05)
+            assert message.edits == [1, 5]
+            assert message.max_in_flight == 1
+        asyncio.run(run())
+
+    def test_cancel(self):
+        async def run():
+            message = Message()
+            edits = EditCoalescer(message.edit, delay=0.01)
+            edits.request()
+            await edits.cancel()
+            await asyncio.sleep(0.03)
+            assert message.edits == []
+        asyncio.run(run())
+
+    def test_errors_do_not_stop_editing(self):
+        async def run():
+            message = Message()
+
+            async def edit():
+                if not message.edits:
+                    message.edits.append('failed')
+                    raise ValueError('render failed')
+                await message.edit()
+
+            edits = EditCoalescer(edit, delay=0)
+            edits.request()
+            await asyncio.sleep(0.005)
+            edits.request()
+            await asyncio.sleep(0.005)  # Second edit in flight
+            await edits.cancel()
+            assert message.edits == ['failed', 0]
+        asyncio.run(run())
+
+    def test_cancel_does_not_raise(self):
+        async def run():
+            async def edit():
+                await asyncio.sleep(0.01)
+                raise asyncio.TimeoutError()
+
+            edits = EditCoalescer(edit, delay=0)
+            edits.request()
+            await asyncio.sleep(0.005)  # Edit in flight
+            await edits.cancel()
+        asyncio.run(run())
@@ -0,0 +1,126 @@
+import asyncio
+from types import SimpleNamespace
+
+import discord
+
+from .selector import SelectMode, Selector, SelectorItem, SelectorItems, selector_button_callback
+
+
+class Response():
+    async def defer(self):
+        pass
+
+
+def make_ctx():
+    permissions = SimpleNamespace(embed_links=True, send_messages=True)
+    channel = SimpleNamespace(permissions_for=lambda _: permissions)
+    author = SimpleNamespace(id=1)
+    return SimpleNamespace(channel=channel, guild=SimpleNamespace(me=None), bot=SimpleNamespace(user=None),
+                           author=author)
+
+
+def make_selector(items, made):
+    @selector_button_callback
+    async def toggle(_interaction, button, item):
+        button.style = discord.ButtonStyle.red if button.style == discord.ButtonStyle.gray else discord.ButtonStyle.gray
+        return item
+
+    def make_choice(position, item):
+        made.append(position)
+        return SelectorItem(f'`{position + 1}` {item}', str(position + 1), toggle(item))
+
+    return Selector(make_ctx(), SelectorItems(items, make_choice), select_mode=SelectMode.MultiSelect)
+
+
+def click(button, custom_id=None):
+    interaction = SimpleNamespace(user=SimpleNamespace(id=1), response=Response(),
+                                  data={'custom_id': custom_id or button.custom_id})
+    return button.callback(interaction)
+
+
+class TestSelector():
+    def test_only_visible_page_is_built(self):
+        async def run():
+            made = []
+            selector = make_selector([f'track {i}' for i in range(2000)], made)
+            assert selector.page_count == 400
+            assert len(selector.buttons) == 5
+
+            selector.page_number = 0
+            selector.build_view()
+            assert [button.label for button in selector.currently_visible_buttons] == ['1', '2', '3', '4', '5']
+            assert selector.get_page(399).description == '\n'.join(f'`{i + 1}` track {i}' for i in range(1995, 2000))
+            assert len(made) == 10
+        asyncio.run(run())
+
+    def test_styles_follow_choices(self):
+        async def run():
+            selector = make_selector([f'track {i}' for i in range(12)], [])
+            selector.page_number = 0
+            selector.build_view()
+            await click(selector.buttons[1])
+            assert selector.callback_results == ['track 1']
+            assert selector.button_styles == {1: discord.ButtonStyle.red}
+
+            # The last page has fewer choices, the same buttons are reused
+            selector.page_number = 2
+            selector.update_view()
+            assert [button.label for button in selector.currently_visible_buttons] == ['11', '12']
+            assert all(button.style == discord.ButtonStyle.gray for button in selector.currently_visible_buttons)
+
+            selector.page_number = 0
+            selector.update_view()
+            assert selector.buttons[1].style == discord.ButtonStyle.red
+        asyncio.run(run())
+
+    def test_default_text(self):
+        async def run():
+            @selector_button_callback
+            async def noop(_interaction, _button):
+                pass
+
+            selector = Selector(make_ctx(), [SelectorItem("", '⏪', noop())], select_mode=SelectMode.MultiSelect,
+                                default_text='controls')
+            assert selector.page_count == 1
+            assert selector.get_page(0).description == 'controls'
+        asyncio.run(run())
+
+    def test_items_are_snapshot(self):
+        async def run():
+            queue = [f'track {i}' for i in range(7)]
+            selector = make_selector(queue, [])
+            queue.pop(0)
+            queue.clear()
+            assert selector.page_count == 2
+            assert selector.get_page(1).description == '`6` track 5\n`7` track 6'
+        asyncio.run(run())
+
+    def test_click_on_page_not_yet_shown(self):
+        async def run():
+            selector = make_selector([f'track {i}' for i in range(12)], [])
+            selector.page_number = 0
+            selector.build_view()
+            shown = selector.buttons[0].custom_id
+
+            # The page changes right away, the message still shows the first page until it is edited
+            selector.page_number = 1
+            selector.update_view()
+            await click(selector.buttons[0], shown)
+            assert selector.callback_results == ['track 0']
+            assert selector.button_styles == {0: discord.ButtonStyle.red}
+            assert selector.buttons[0].style == discord.ButtonStyle.gray  # Still shows the choice of page two
+
+            await click(selector.buttons[0])
+            assert selector.callback_results == ['track 0', 'track 5']
+            assert selector.button_styles == {0: discord.ButtonStyle.red, 5: discord.ButtonStyle.red}
+        asyncio.run(run())
+
+    def test_long_lines_fit_the_page(self):
+        async def run():
+            selector = make_selector(['a' * 1000 for _ in range(7)], [])
+            description = selector.get_page(0).description
+            assert len(description) <= 2000
+            assert description.count('\n') == 4
+            assert description.endswith('…')
+            assert selector.get_page(1).description.count('\n') == 1
+        asyncio.run(run())
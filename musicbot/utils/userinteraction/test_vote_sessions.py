@@ -0,0 +1,78 @@
+import asyncio
+from types import SimpleNamespace
+
+from .vote_sessions import VoteSessions
+
+
+def reaction(message_id, member_id, emoji='👍'):
+    return SimpleNamespace(message_id=message_id, member=SimpleNamespace(id=member_id), emoji=emoji)
+
+
+class Vote():
+    def __init__(self, sessions, message_id, required=2):
+        self.sessions = sessions
+        self.message_id = message_id
+        self.required = required
+        self.voters = set()
+        self.passed = 0
+        self.timed_out = 0
+
+    async def on_vote(self, member):
+        if member.id in self.voters:
+            return False
+        self.voters.add(member.id)
+        if len(self.voters) >= self.required:
+            self.sessions.close(self.message_id)
+            await asyncio.sleep(0)
+            self.passed += 1
+        return True
+
+    async def on_timeout(self):
+        self.timed_out += 1
+
+
+class TestVoteSessions():
+    def test_reactions_go_to_their_vote(self):
+        async def run():
+            sessions = VoteSessions()
+            first, second = Vote(sessions, 1), Vote(sessions, 2)
+            sessions.open(1, first.on_vote, first.on_timeout)
+            sessions.open(2, second.on_vote, second.on_timeout)
+
+            await sessions.handle_reaction(reaction(1, 10))
+            await sessions.handle_reaction(reaction(1, 11, emoji='👎'))
+            await sessions.handle_reaction(reaction(3, 11))
+            assert first.voters == {10}
+            assert second.voters == set()
+
+            await asyncio.gather(*(sessions.handle_reaction(reaction(1, member)) for member in (11, 12, 13)))
+            assert first.passed == 1
+            assert 1 not in sessions and 2 in sessions
+            sessions.close_all()
+            assert len(sessions) == 0
+        asyncio.run(run())
+
+    def test_timeout(self):
+        async def run():
+            sessions = VoteSessions()
+            vote = Vote(sessions, 1, required=3)
+            sessions.open(1, vote.on_vote, vote.on_timeout, timeout=0.03)
+            await asyncio.sleep(0.02)
+            await sessions.handle_reaction(reaction(1, 10))  # A counted vote restarts the timeout
+            await asyncio.sleep(0.02)
+            assert vote.timed_out == 0
+            await asyncio.sleep(0.03)
+            assert vote.timed_out == 1
+            assert 1 not in sessions
+        asyncio.run(run())
+
+    def test_closed_vote_does_not_time_out(self):
+        async def run():
+            sessions = VoteSessions()
+            vote = Vote(sessions, 1)
+            sessions.open(1, vote.on_vote, vote.on_timeout, timeout=0.01)
+            assert sessions.close(1)
+            assert not sessions.close(1)
+            await asyncio.sleep(0.02)
+            assert vote.timed_out == 0
+        asyncio.run(run())
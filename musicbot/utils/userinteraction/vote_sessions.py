@@ -0,0 +1,85 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+import discord
+
+
+class VoteSession:
+    __slots__ = ('message_id', 'emoji', 'timeout', 'on_vote', 'on_timeout', 'timer')
+
+    def __init__(self, message_id: int, emoji: str, timeout: float,
+                 on_vote: Callable[[discord.Member], Awaitable[bool]], on_timeout: Callable[[], Awaitable]):
+        self.message_id = message_id
+        self.emoji = emoji
+        self.timeout = timeout
+        self.on_vote = on_vote
+        self.on_timeout = on_timeout
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class VoteSessions:
+    """
+    Votes collected by reacting to a message, indexed by the id of the message.
+    A single reaction listener feeds every open vote, so a reaction to any other message is one dictionary lookup.
+    Timeouts are timers on the event loop, restarted by every counted vote.
+    """
+    def __init__(self):
+        self._sessions: Dict[int, VoteSession] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self.logger = logging.getLogger("musicbot").getChild("VoteSessions")
+
+    def __contains__(self, message_id: int) -> bool:
+        return message_id in self._sessions
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def open(self, message_id: int, on_vote: Callable[[discord.Member], Awaitable[bool]],
+             on_timeout: Callable[[], Awaitable], emoji: str = '👍', timeout: float = 15.0):
+        """
+        on_vote: called with the member reacting with emoji, returns whether the vote was counted.
+        on_timeout: called when no vote was counted for timeout seconds, the session is closed by then.
+        """
+        self.close(message_id)
+        session = self._sessions[message_id] = VoteSession(message_id, emoji, timeout, on_vote, on_timeout)
+        self._start_timer(session)
+
+    def close(self, message_id: int) -> bool:
+        """Stops collecting votes for a message, returns whether a vote was open."""
+        if (session := self._sessions.pop(message_id, None)) is None:
+            return False
+        if session.timer is not None:
+            session.timer.cancel()
+        return True
+
+    def close_all(self):
+        for message_id in list(self._sessions):
+            self.close(message_id)
+
+    def _start_timer(self, session: VoteSession):
+        if session.timer is not None:
+            session.timer.cancel()
+        session.timer = asyncio.get_running_loop().call_later(session.timeout, self._expire, session)
+
+    def _expire(self, session: VoteSession):
+        if self._sessions.get(session.message_id) is not session:
+            return
+        del self._sessions[session.message_id]
+        self.logger.debug("Vote on message %s timed out", session.message_id)
+        task = asyncio.create_task(self._run_timeout(session))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_timeout(self, session: VoteSession):
+        try:
+            await session.on_timeout()
+        except discord.HTTPException as err:
+            self.logger.debug("Could not end vote on message %s: %s", session.message_id, err)
+
+    async def handle_reaction(self, payload: discord.RawReactionActionEvent):
+        session = self._sessions.get(payload.message_id)
+        if session is None or payload.member is None or str(payload.emoji) != session.emoji:
+            return
+        if await session.on_vote(payload.member) and self._sessions.get(payload.message_id) is session:
+            self._start_timer(session)